@@ -7,13 +7,89 @@ It registers blueprints, error handlers, and applies middleware.
 
 Used by: wsgi.py for production deployment
 """
-from flask import Flask, jsonify, send_from_directory
+from flask import Flask, jsonify
 from flask.logging import default_handler
+from whitenoise import WhiteNoise
+from apscheduler.schedulers.background import BackgroundScheduler
+import functools
 import logging
 import os
 import threading
 import time
-from datetime import datetime
+
+from app.utils.helpers import generate_timestamp
+
+
+# Cached /ready dependency probe results (refreshed at most every TTL seconds)
+_HEALTH_CACHE_TTL = 30
+_HEALTH_CACHE = {'ts': 0.0, 'payload': None}
+_HEALTH_LOCK = threading.Lock()
+
+# Content Security Policy (constant, built once at import)
+_CSP = (
+    "default-src 'self'; "
+    "script-src 'self' https://cdn.tailwindcss.com https://unpkg.com 'unsafe-inline'; "
+    "style-src 'self' https://cdn.tailwindcss.com https://fonts.googleapis.com 'unsafe-inline'; "
+    "img-src 'self' data: https: https://picoshare-production-7223.up.railway.app; "
+    "font-src 'self' data: https://fonts.gstatic.com; "
+    "connect-src 'self';"
+)
+
+# Security headers added to every response
+_SECURITY_HEADERS = (
+    ('X-Content-Type-Options', 'nosniff'),
+    ('X-Frame-Options', 'DENY'),
+    ('X-XSS-Protection', '1; mode=block'),
+    ('Content-Security-Policy', _CSP),
+    ('Referrer-Policy', 'strict-origin-when-cross-origin'),
+)
+
+# HSTS is only sent outside debug mode
+_HSTS_HEADER = ('Strict-Transport-Security', 'max-age=31536000; includeSubDomains')
+_SECURITY_HEADERS_WITH_HSTS = _SECURITY_HEADERS + (_HSTS_HEADER,)
+
+# WeasyPrint version, resolved on first use
+_WEASYPRINT_VERSION = None
+
+
+@functools.lru_cache(maxsize=1)
+def _pandoc_version():
+    """
+    Get the Pandoc version, computed once per process.
+
+    pypandoc shells out to `pandoc --version`, and the binary cannot change
+    under a running worker.
+    """
+    import pypandoc
+    return pypandoc.get_pandoc_version()
+
+
+def _weasyprint_version():
+    """Get the WeasyPrint version, importing it once per process."""
+    global _WEASYPRINT_VERSION
+    if _WEASYPRINT_VERSION is None:
+        from weasyprint import __version__
+        _WEASYPRINT_VERSION = __version__
+    return _WEASYPRINT_VERSION
+
+
+def _fs_probe(path):
+    """
+    Check whether a path exists and is writable.
+
+    Writability is checked with os.access against this process's
+    credentials, which also answers existence when it succeeds, so a
+    healthy writable path costs a single syscall.
+
+    Args:
+        path: Filesystem path to probe
+
+    Returns:
+        Tuple of (exists, writable)
+    """
+    if os.access(path, os.W_OK):
+        return True, True
+    return os.path.exists(path), False
 
 
 def create_app(config_name='default'):
@@ -32,10 +108,21 @@ def create_app(config_name='default'):
     static_folder = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'static')
     app = Flask(__name__, static_folder=static_folder)
 
+    # Serialize JSON responses with orjson when available
+    from app.utils.json_provider import ORJSONProvider, ORJSON_AVAILABLE
+    if ORJSON_AVAILABLE:
+        app.json = ORJSONProvider(app)
+
     # Load configuration
     from app.config import config
     app.config.from_object(config[config_name])
 
+    if config_name == 'production' and not app.config.get('SECRET_KEY'):
+        raise RuntimeError(
+            'SECRET_KEY must be set in production '
+            '(SECRET_KEY environment variable or SECRET_KEY_FILE)'
+        )
+
     # Configure logging
     configure_logging(app)
 
@@ -57,31 +144,7 @@ def create_app(config_name='default'):
 
     # Register OAuth blueprint (Flask-Dance)
     if app.config.get('GOOGLE_OAUTH_CLIENT_ID') and app.config.get('GOOGLE_OAUTH_CLIENT_SECRET'):
-        from flask_dance.contrib.google import make_google_blueprint
-        from werkzeug.middleware.proxy_fix import ProxyFix
-
-        # Fix for HTTPS behind reverse proxy (Railway)
-        app.wsgi_app = ProxyFix(app.wsgi_app, x_proto=1, x_host=1)
-
-        # Disable HTTPS requirement for local development only
-        os.environ['OAUTHLIB_INSECURE_TRANSPORT'] = str(app.config.get('OAUTHLIB_INSECURE_TRANSPORT', 'False'))
-
-        google_bp = make_google_blueprint(
-            client_id=app.config['GOOGLE_OAUTH_CLIENT_ID'],
-            client_secret=app.config['GOOGLE_OAUTH_CLIENT_SECRET'],
-            scope=[
-                'https://www.googleapis.com/auth/documents',
-                'https://www.googleapis.com/auth/drive.file',
-                'openid',
-                'email',
-                'profile'
-            ],
-            offline=True,  # Request refresh token
-            storage=None,  # Use session storage (default)
-        )
-        app.register_blueprint(google_bp, url_prefix='/login')
-
-        app.logger.info(f'Google OAuth blueprint registered at /login')
+        register_google_oauth(app)
     else:
         app.logger.warning('Google OAuth not configured - Google Docs conversion disabled')
 
@@ -94,11 +157,12 @@ def create_app(config_name='default'):
     app.register_blueprint(api_blueprint, url_prefix='/api')
 
     # Log all registered routes for debugging (after all blueprints registered)
-    with app.app_context():
-        app.logger.info('=== Registered Routes ===')
-        for rule in app.url_map.iter_rules():
-            app.logger.info(f'  {rule.methods} {rule.rule} -> {rule.endpoint}')
-        app.logger.info('=== End Routes ===')
+    if app.config.get('STARTUP_DIAG'):
+        with app.app_context():
+            app.logger.info('=== Registered Routes ===')
+            for rule in app.url_map.iter_rules():
+                app.logger.info(f'  {rule.methods} {rule.rule} -> {rule.endpoint}')
+            app.logger.info('=== End Routes ===')
 
 
     # Register error handlers
@@ -108,31 +172,54 @@ def create_app(config_name='default'):
     @app.after_request
     def add_security_headers(response):
         """Add security headers to all responses"""
-        response.headers['X-Content-Type-Options'] = 'nosniff'
-        response.headers['X-Frame-Options'] = 'DENY'
-        response.headers['X-XSS-Protection'] = '1; mode=block'
-
-        if not app.debug:
-            response.headers['Strict-Transport-Security'] = 'max-age=31536000; includeSubDomains'
-
-        # Content Security Policy
-        csp = (
-            "default-src 'self'; "
-            "script-src 'self' https://cdn.tailwindcss.com https://unpkg.com 'unsafe-inline'; "
-            "style-src 'self' https://cdn.tailwindcss.com https://fonts.googleapis.com 'unsafe-inline'; "
-            "img-src 'self' data: https: https://picoshare-production-7223.up.railway.app; "
-            "font-src 'self' data: https://fonts.gstatic.com; "
-            "connect-src 'self';"
+        # One extend call instead of a case-insensitive lookup per header
+        response.headers.extend(
+            _SECURITY_HEADERS if app.debug else _SECURITY_HEADERS_WITH_HSTS
         )
-        response.headers['Content-Security-Policy'] = csp
-        response.headers['Referrer-Policy'] = 'strict-origin-when-cross-origin'
-
         return response
 
-    # Health check endpoint
+    # Serve static assets with WhiteNoise so they never reach the Flask dispatcher
+    app.wsgi_app = WhiteNoise(
+        app.wsgi_app,
+        root=static_folder,
+        index_file=True,
+        autorefresh=app.debug,
+        add_headers_function=lambda headers, path, url: apply_security_headers(
+            headers, include_hsts=not app.debug
+        )
+    )
+
+    # Liveness endpoint - no imports, no syscalls
     @app.route('/health')
     def health_check():
-        """Health check endpoint for Railway monitoring with detailed diagnostics"""
+        """Liveness endpoint for load balancer / container probes"""
+        return jsonify({'status': 'ok'}), 200
+
+    # Readiness endpoint
+    @app.route('/ready')
+    def readiness_check():
+        """Readiness endpoint for Railway monitoring with detailed diagnostics"""
+        # Fast path: serve cached probe results, only the timestamp is regenerated
+        if time.monotonic() - _HEALTH_CACHE['ts'] < _HEALTH_CACHE_TTL:
+            return jsonify(_with_timestamp(_HEALTH_CACHE['payload'])), 200
+
+        # Only one thread recomputes when the cache expires
+        with _HEALTH_LOCK:
+            if time.monotonic() - _HEALTH_CACHE['ts'] >= _HEALTH_CACHE_TTL:
+                _HEALTH_CACHE['payload'] = probe_dependencies()
+                _HEALTH_CACHE['ts'] = time.monotonic()
+            payload = _HEALTH_CACHE['payload']
+
+        return jsonify(_with_timestamp(payload)), 200
+
+    def _with_timestamp(payload):
+        """Copy cached readiness payload with a fresh timestamp"""
+        response = dict(payload)
+        response['timestamp'] = generate_timestamp()
+        return response
+
+    def probe_dependencies():
+        """Run the dependency and filesystem probes behind /ready"""
         import traceback
 
         health_status = {
@@ -140,16 +227,14 @@ def create_app(config_name='default'):
             'service': 'md-converter',
             'version': '1.0.0',
             'dependencies': {},
-            'diagnostics': {},
-            'timestamp': datetime.utcnow().isoformat() + 'Z'
+            'diagnostics': {}
         }
 
         is_healthy = True
 
         # Check pypandoc/pandoc
         try:
-            import pypandoc
-            pandoc_version = pypandoc.get_pandoc_version()
+            pandoc_version = _pandoc_version()
             health_status['dependencies']['pandoc'] = pandoc_version
             app.logger.info(f'Pandoc version: {pandoc_version}')
         except Exception as e:
@@ -165,7 +250,7 @@ def create_app(config_name='default'):
 
         # Check weasyprint
         try:
-            from weasyprint import __version__ as weasyprint_version
+            weasyprint_version = _weasyprint_version()
             health_status['dependencies']['weasyprint'] = weasyprint_version
             app.logger.info(f'WeasyPrint version: {weasyprint_version}')
         except Exception as e:
@@ -191,12 +276,13 @@ def create_app(config_name='default'):
         try:
             converted_folder = app.config.get('CONVERTED_FOLDER', '/tmp/converted')
             health_status['diagnostics']['converted_folder'] = str(converted_folder)
-            health_status['diagnostics']['converted_folder_exists'] = os.path.exists(converted_folder)
-            health_status['diagnostics']['converted_folder_writable'] = os.access(converted_folder, os.W_OK)
+            converted_exists, converted_writable = _fs_probe(converted_folder)
+            health_status['diagnostics']['converted_folder_exists'] = converted_exists
+            health_status['diagnostics']['converted_folder_writable'] = converted_writable
 
             static_folder = app.static_folder
             health_status['diagnostics']['static_folder'] = str(static_folder)
-            health_status['diagnostics']['static_folder_exists'] = os.path.exists(static_folder) if static_folder else False
+            health_status['diagnostics']['static_folder_exists'] = _fs_probe(static_folder)[0] if static_folder else False
         except Exception as e:
             app.logger.error(f'Filesystem check failed: {e}')
             health_status['diagnostics']['filesystem_error'] = str(e)
@@ -209,79 +295,128 @@ def create_app(config_name='default'):
         else:
             app.logger.info('Health check PASSED - All dependencies available')
 
-        return jsonify(health_status), 200
-
-    # Serve static files
-    @app.route('/')
-    def index():
-        """Serve the main application page"""
-        return send_from_directory(app.static_folder, 'index.html')
+        return health_status
 
+    # Static files (/, /favicon.ico, /css/*, /js/*) are served by WhiteNoise
     @app.route('/privacy')
     def privacy():
         """Serve the privacy policy page"""
         from flask import render_template
         return render_template('privacy.html')
 
-    @app.route('/favicon.ico')
-    def favicon():
-        """Serve favicon"""
-        return send_from_directory(app.static_folder, 'favicon.ico', mimetype='image/x-icon')
+    app.logger.info(f'Flask application created with config: {config_name}')
 
-    @app.route('/<path:path>')
-    def static_files(path):
-        """Serve other static files"""
-        return send_from_directory(app.static_folder, path)
+    # Startup diagnostics (runs per worker, so opt-in only - /ready
+    # reports the same information on demand)
+    if app.config.get('STARTUP_DIAG'):
+        with app.app_context():
+            app.logger.info('=== Startup Diagnostics ===')
+            app.logger.info(f'Python version: {os.sys.version}')
+            app.logger.info(f'Working directory: {os.getcwd()}')
+            app.logger.info(f'Static folder: {app.static_folder}')
+            app.logger.info(f'Static folder exists: {os.path.exists(app.static_folder) if app.static_folder else False}')
+            app.logger.info(f'Converted folder: {app.config.get("CONVERTED_FOLDER")}')
+            app.logger.info(f'Converted folder exists: {os.path.exists(app.config.get("CONVERTED_FOLDER", ""))}')
+
+            # Test dependencies
+            try:
+                version = _pandoc_version()
+                app.logger.info(f'✓ Pandoc available: version {version}')
+            except Exception as e:
+                app.logger.error(f'✗ Pandoc unavailable: {type(e).__name__}: {e}')
 
-    app.logger.info(f'Flask application created with config: {config_name}')
+            try:
+                app.logger.info(f'✓ WeasyPrint available: version {_weasyprint_version()}')
+            except Exception as e:
+                app.logger.error(f'✗ WeasyPrint unavailable: {type(e).__name__}: {e}')
 
-    # Startup diagnostics
-    with app.app_context():
-        app.logger.info('=== Startup Diagnostics ===')
-        app.logger.info(f'Python version: {os.sys.version}')
-        app.logger.info(f'Working directory: {os.getcwd()}')
-        app.logger.info(f'Static folder: {app.static_folder}')
-        app.logger.info(f'Static folder exists: {os.path.exists(app.static_folder) if app.static_folder else False}')
-        app.logger.info(f'Converted folder: {app.config.get("CONVERTED_FOLDER")}')
-        app.logger.info(f'Converted folder exists: {os.path.exists(app.config.get("CONVERTED_FOLDER", ""))}')
-
-        # Test dependencies
-        try:
-            import pypandoc
-            version = pypandoc.get_pandoc_version()
-            app.logger.info(f'✓ Pandoc available: version {version}')
-        except Exception as e:
-            app.logger.error(f'✗ Pandoc unavailable: {type(e).__name__}: {e}')
+            app.logger.info('=== End Startup Diagnostics ===')
+
+    # Schedule background cleanup (JOB_RETENTION_HOURS file retention)
+    retention_hours = app.config['JOB_RETENTION_HOURS']
+
+    def cleanup_job():
+        """Scheduled job that cleans up files older than the retention period"""
+        from app.utils.file_handler import cleanup_old_files
 
         try:
-            from weasyprint import __version__
-            app.logger.info(f'✓ WeasyPrint available: version {__version__}')
+            converted_folder = app.config.get('CONVERTED_FOLDER')
+            if converted_folder and os.path.exists(converted_folder):
+                deleted = cleanup_old_files(str(converted_folder), max_age_hours=retention_hours)
+                if deleted > 0:
+                    app.logger.info(f'Background cleanup: Deleted {deleted} job directories older than {retention_hours} hour(s)')
         except Exception as e:
-            app.logger.error(f'✗ WeasyPrint unavailable: {type(e).__name__}: {e}')
+            app.logger.error(f'Background cleanup error: {e}', exc_info=True)
+
+    scheduler = BackgroundScheduler(daemon=True)
+    scheduler.add_job(
+        cleanup_job,
+        'interval',
+        minutes=5,  # Run every 5 minutes
+        id='cleanup',
+        max_instances=1,
+        coalesce=True
+    )
+    scheduler.start()
+    app.extensions['scheduler'] = scheduler
+    app.logger.info(f'Background cleanup scheduler started ({retention_hours}-hour file retention)')
 
-        app.logger.info('=== End Startup Diagnostics ===')
+    return app
 
-    # Start background cleanup thread (1 hour file retention)
-    def cleanup_worker():
-        """Background thread that cleans up files older than 1 hour"""
-        from app.utils.file_handler import cleanup_old_files
 
-        while True:
-            try:
-                time.sleep(300)  # Run every 5 minutes
-                converted_folder = app.config.get('CONVERTED_FOLDER')
-                if converted_folder and os.path.exists(converted_folder):
-                    deleted = cleanup_old_files(str(converted_folder), max_age_hours=1)
-                    if deleted > 0:
-                        app.logger.info(f'Background cleanup: Deleted {deleted} job directories older than 1 hour')
-            except Exception as e:
-                app.logger.error(f'Background cleanup error: {e}', exc_info=True)
+def apply_security_headers(headers, include_hsts=True):
+    """
+    Set security headers on a response header collection.
 
-    cleanup_thread = threading.Thread(target=cleanup_worker, daemon=True, name='CleanupWorker')
-    cleanup_thread.start()
-    app.logger.info('Background cleanup thread started (1-hour file retention)')
+    Used for WhiteNoise static responses, whose wsgiref Headers object has
+    no extend(); Flask responses extend their headers directly.
 
-    return app
+    Args:
+        headers: Response headers (wsgiref Headers)
+        include_hsts: Whether to add Strict-Transport-Security
+    """
+    for name, value in _SECURITY_HEADERS:
+        headers[name] = value
+
+    if include_hsts:
+        headers[_HSTS_HEADER[0]] = _HSTS_HEADER[1]
+
+
+def register_google_oauth(app):
+    """
+    Register the Flask-Dance Google OAuth blueprint.
+
+    Flask-Dance is imported here so that deployments without OAuth
+    configured never pay its import cost.
+
+    Args:
+        app: Flask application instance
+    """
+    from flask_dance.contrib.google import make_google_blueprint
+    from werkzeug.middleware.proxy_fix import ProxyFix
+
+    # Fix for HTTPS behind reverse proxy (Railway)
+    app.wsgi_app = ProxyFix(app.wsgi_app, x_proto=1, x_host=1)
+
+    # Disable HTTPS requirement for local development only
+    os.environ['OAUTHLIB_INSECURE_TRANSPORT'] = str(app.config.get('OAUTHLIB_INSECURE_TRANSPORT', 'False'))
+
+    google_bp = make_google_blueprint(
+        client_id=app.config['GOOGLE_OAUTH_CLIENT_ID'],
+        client_secret=app.config['GOOGLE_OAUTH_CLIENT_SECRET'],
+        scope=[
+            'https://www.googleapis.com/auth/documents',
+            'https://www.googleapis.com/auth/drive.file',
+            'openid',
+            'email',
+            'profile'
+        ],
+        offline=True,  # Request refresh token
+        storage=None,  # Use session storage (default)
+    )
+    app.register_blueprint(google_bp, url_prefix='/login')
+
+    app.logger.info(f'Google OAuth blueprint registered at /login')
 
 
 def configure_logging(app):
@@ -324,7 +459,7 @@ def register_error_handlers(app):
             'error': 'Bad request',
             'code': 'BAD_REQUEST',
             'status': 400,
-            'timestamp': datetime.utcnow().isoformat() + 'Z'
+            'timestamp': generate_timestamp()
         }), 400
 
     @app.errorhandler(404)
@@ -334,7 +469,7 @@ def register_error_handlers(app):
             'error': 'Resource not found',
             'code': 'NOT_FOUND',
             'status': 404,
-            'timestamp': datetime.utcnow().isoformat() + 'Z'
+            'timestamp': generate_timestamp()
         }), 404
 
     @app.errorhandler(413)
@@ -346,7 +481,7 @@ def register_error_handlers(app):
             'code': 'FILE_TOO_LARGE',
             'status': 413,
             'max_size': max_size,
-            'timestamp': datetime.utcnow().isoformat() + 'Z'
+            'timestamp': generate_timestamp()
         }), 413
 
     @app.errorhandler(415)
@@ -356,7 +491,7 @@ def register_error_handlers(app):
             'error': 'Unsupported media type',
             'code': 'UNSUPPORTED_MEDIA_TYPE',
             'status': 415,
-            'timestamp': datetime.utcnow().isoformat() + 'Z'
+            'timestamp': generate_timestamp()
         }), 415
 
     @app.errorhandler(500)
@@ -367,7 +502,7 @@ def register_error_handlers(app):
             'error': 'Internal server error',
             'code': 'INTERNAL_ERROR',
             'status': 500,
-            'timestamp': datetime.utcnow().isoformat() + 'Z'
+            'timestamp': generate_timestamp()
         }), 500
 
     @app.errorhandler(503)
@@ -377,5 +512,5 @@ def register_error_handlers(app):
             'error': 'Service temporarily unavailable',
             'code': 'SERVICE_UNAVAILABLE',
             'status': 503,
-            'timestamp': datetime.utcnow().isoformat() + 'Z'
+            'timestamp': generate_timestamp()
         }), 503
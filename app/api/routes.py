@@ -14,35 +14,36 @@ Dependencies:
 
 Used by: app/__init__.py via blueprint registration
 """
-from flask import request, jsonify, send_file, current_app, session
+from flask import request, jsonify, send_file, current_app, session, g
 from werkzeug.utils import secure_filename
 from pathlib import Path
 from datetime import datetime
+from typing import Tuple
+from concurrent.futures import ThreadPoolExecutor
 import logging
 import os
 import io
 
 from app.api import api_blueprint
-from app.api.validators import validate_upload, validate_job_id, validate_content_encoding, validate_markdown_content
-from app.converters import MarkdownConverter, HtmlConverter
+from app.api.validators import validate_upload, validate_job_id, validate_markdown_content
 from app.utils.file_handler import (
     generate_job_id,
     get_job_directory,
     get_file_path,
-    get_file_info,
-    is_job_expired,
-    cleanup_old_files
+    is_job_expired
 )
 from app.utils.helpers import (
     format_error_response,
     get_mime_type,
     calculate_processing_time,
-    format_file_size
+    format_file_size,
+    generate_timestamp
 )
-from app.utils.security import sanitize_filename
+from app.utils.security import sanitize_filename, sanitize_html
 from app.utils.encryption import (
     generate_encryption_key,
     encrypt_file_in_place,
+    encrypt_to_file,
     decrypt_to_stream,
     key_to_string,
     string_to_key
@@ -51,6 +52,23 @@ from app.utils.encryption import (
 
 logger = logging.getLogger(__name__)
 
+# Output formats accepted by /api/convert
+_VALID_FORMATS = frozenset({'docx', 'pdf', 'gdocs'})
+
+
+@api_blueprint.before_request
+def resolve_google_authorization():
+    """
+    Resolve the Google OAuth state once for conversions that need it.
+
+    google.authorized reads the Flask-Dance token storage (and may refresh
+    the token), so it is evaluated here once and cached on flask.g.
+    """
+    if request.endpoint == 'api.convert' and 'gdocs' in request.form.getlist('formats'):
+        # Deferred so requests without gdocs never load Flask-Dance
+        from flask_dance.contrib.google import google
+        g.google_authorized = google.authorized
+
 
 @api_blueprint.route('/convert', methods=['POST'])
 def convert():
@@ -87,8 +105,9 @@ def convert():
         # Extract file
         file = request.files['file']
         original_filename = secure_filename(file.filename)
-        base_name = Path(original_filename).stem
-        file_ext = Path(original_filename).suffix.lower()
+        original_path = Path(original_filename)
+        base_name = original_path.stem
+        file_ext = original_path.suffix.lower()
 
         # Detect file type (HTML vs Markdown)
         is_html = file_ext in ['.html', '.htm']
@@ -104,7 +123,16 @@ def convert():
                 formats = ['docx', 'pdf']
             elif legacy_format in ['docx', 'pdf']:
                 # Legacy single format - return file directly
-                return handle_legacy_single_format(file, legacy_format, base_name)
+                try:
+                    _, content = _decode_upload(file)
+                except UnicodeDecodeError:
+                    error = format_error_response(
+                        'INVALID_ENCODING',
+                        'File must be UTF-8 encoded',
+                        422
+                    )
+                    return jsonify(error), 422
+                return handle_legacy_single_format(content, legacy_format, base_name, is_html)
             else:
                 error = format_error_response(
                     'NO_FORMAT_SELECTED',
@@ -114,22 +142,20 @@ def convert():
                 return jsonify(error), 400
 
         # Validate formats
-        valid_formats = {'docx', 'pdf', 'gdocs'}
-        invalid_formats = set(formats) - valid_formats
+        invalid_formats = set(formats) - _VALID_FORMATS
 
         if invalid_formats:
             error = format_error_response(
                 'INVALID_FORMAT',
                 f'Invalid format(s): {", ".join(invalid_formats)}',
                 400,
-                {'valid_formats': list(valid_formats)}
+                {'valid_formats': list(_VALID_FORMATS)}
             )
             return jsonify(error), 400
 
         # Check authentication for Google Docs
         if 'gdocs' in formats:
-            from flask_dance.contrib.google import google
-            if not google.authorized:
+            if not g.get('google_authorized', False):
                 error = format_error_response(
                     'AUTH_REQUIRED',
                     'Google Docs conversion requires authentication. Please sign in.',
@@ -138,16 +164,24 @@ def convert():
                 )
                 return jsonify(error), 401
 
-        logger.info(f'Converting file: {original_filename} to formats: {formats}')
+        # Google Docs needs the OAuth session, so build its converter on the
+        # request thread - the conversion workers below run outside the
+        # Flask request context. Done before reading the upload so a bad
+        # credential is rejected without decoding the file.
+        gdocs_converter = None
+        if 'gdocs' in formats:
+            try:
+                gdocs_converter = _build_gdocs_converter()
+            except Exception as e:
+                logger.error(f'Google Docs conversion failed: {e}', exc_info=True)
+                error = _gdocs_error_response(e)
+                return jsonify(error), error['status']
 
-        # Validate encoding
-        encoding_error = validate_content_encoding(file)
-        if encoding_error:
-            return jsonify(encoding_error), encoding_error['status']
+        logger.info(f'Converting file: {original_filename} to formats: {formats}')
 
-        # Read content
+        # All cheap checks have passed - only now consume the stream
         try:
-            content = file.read().decode('utf-8')
+            raw, content = _decode_upload(file)
         except UnicodeDecodeError:
             error = format_error_response(
                 'INVALID_ENCODING',
@@ -156,8 +190,9 @@ def convert():
             )
             return jsonify(error), 422
 
-        # Validate content
-        content_error = validate_markdown_content(content)
+        # Validate content (null-byte scan runs on the raw bytes)
+        content_error = validate_markdown_content(content, raw)
+        del raw  # Only the decoded text is needed from here on
         if content_error:
             return jsonify(content_error), content_error['status']
 
@@ -172,6 +207,8 @@ def convert():
         logger.info(f'Job ID: {job_id}, Directory: {job_dir}')
 
         # Initialize appropriate converter based on file type
+        # (imported lazily so pypandoc/weasyprint load on first conversion, not at startup)
+        from app.converters import MarkdownConverter, HtmlConverter
         if is_html:
             converter = HtmlConverter()
         else:
@@ -179,147 +216,58 @@ def convert():
             template_path = current_app.config.get('WORD_TEMPLATE_PATH')
             converter = MarkdownConverter(template_path=template_path)
 
-        # Convert to each requested format
-        results = {}
-
-        # Convert to DOCX
-        if 'docx' in formats:
+        # Validate HTML once here instead of in both the DOCX and PDF workers
+        if is_html and ('docx' in formats or 'pdf' in formats):
             try:
-                docx_path = os.path.join(job_dir, f'{base_name}.docx')
-
-                if is_html:
-                    # HTML conversion
-                    converter.convert_to_docx(content, docx_path, sanitize=True)
-                else:
-                    # Markdown conversion
-                    converter.convert_to_docx(content, docx_path, include_front_matter=True)
-
-                # Encrypt the file
-                if not encrypt_file_in_place(docx_path, encryption_key):
-                    logger.error('Failed to encrypt DOCX file')
-                    error = format_error_response(
-                        'ENCRYPTION_ERROR',
-                        'Failed to secure converted file',
-                        500
-                    )
-                    return jsonify(error), 500
-
-                docx_info = get_file_info(docx_path)
-                results['docx'] = {
-                    'download_url': f'/api/download/{job_id}/docx',
-                    'filename': docx_info['filename'].replace('.docx', ''),  # Remove extension as it's encrypted
-                    'size': docx_info['size'],
-                    'size_formatted': format_file_size(docx_info['size']),
-                    'mimetype': get_mime_type('docx')
-                }
-                logger.info(f'Successfully converted and encrypted DOCX: {docx_path}')
+                content = converter.validate_and_sanitize(content)
             except Exception as e:
-                logger.error(f'DOCX conversion failed: {e}', exc_info=True)
+                fmt = 'DOCX' if 'docx' in formats else 'PDF'
+                logger.error(f'{fmt} conversion failed: {e}', exc_info=True)
                 error = format_error_response(
                     'CONVERSION_ERROR',
-                    'Failed to convert to DOCX',
+                    f'Failed to convert to {fmt}',
                     500
                 )
                 return jsonify(error), 500
 
-        # Convert to PDF
+        # Build one task per requested local format; each writes to its own path in job_dir
+        tasks = []
+        if 'docx' in formats:
+            docx_path = os.path.join(job_dir, f'{base_name}.docx')
+            tasks.append(('docx', lambda: _convert_docx(
+                converter, content, is_html, docx_path, encryption_key, job_id
+            )))
         if 'pdf' in formats:
-            try:
-                pdf_path = os.path.join(job_dir, f'{base_name}.pdf')
-
-                if is_html:
-                    # HTML conversion
-                    converter.convert_to_pdf(content, pdf_path, sanitize=True)
-                else:
-                    # Markdown conversion
-                    converter.convert_to_pdf(content, pdf_path)
-
-                # Encrypt the file
-                if not encrypt_file_in_place(pdf_path, encryption_key):
-                    logger.error('Failed to encrypt PDF file')
-                    error = format_error_response(
-                        'ENCRYPTION_ERROR',
-                        'Failed to secure converted file',
-                        500
-                    )
-                    return jsonify(error), 500
-
-                pdf_info = get_file_info(pdf_path)
-                results['pdf'] = {
-                    'download_url': f'/api/download/{job_id}/pdf',
-                    'filename': pdf_info['filename'].replace('.pdf', ''),  # Remove extension as it's encrypted
-                    'size': pdf_info['size'],
-                    'size_formatted': format_file_size(pdf_info['size']),
-                    'mimetype': get_mime_type('pdf')
-                }
-                logger.info(f'Successfully converted and encrypted PDF: {pdf_path}')
-            except Exception as e:
-                logger.error(f'PDF conversion failed: {e}', exc_info=True)
-                error = format_error_response(
-                    'CONVERSION_ERROR',
-                    'Failed to convert to PDF',
-                    500
-                )
-                return jsonify(error), 500
-
-        # Convert to Google Docs
+            pdf_path = os.path.join(job_dir, f'{base_name}.pdf')
+            tasks.append(('pdf', lambda: _convert_pdf(
+                converter, content, is_html, pdf_path, encryption_key, job_id
+            )))
+
+        # Run local conversions concurrently - pandoc and WeasyPrint release
+        # the GIL, so wall time becomes max(...) instead of sum(...)
+        if len(tasks) == 1:
+            fmt, fn = tasks[0]
+            outcomes = {fmt: fn()}
+        elif tasks:
+            with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+                futures = {fmt: executor.submit(fn) for fmt, fn in tasks}
+            outcomes = {fmt: future.result() for fmt, future in futures.items()}
+
+        # Report the first failure in docx -> pdf order
+        results = {}
+        for fmt, _ in tasks:
+            result, error = outcomes[fmt]
+            if error:
+                return jsonify(error), error['status']
+            results[fmt] = result
+
+        # Create the Google Doc only once the local formats have succeeded,
+        # so a failed request never leaves a document in the user's Drive
         if 'gdocs' in formats:
-            try:
-                from app.utils.oauth_helpers import get_google_credentials
-                from app.utils.google_services import build_google_services
-                from app.converters.google_docs_converter import GoogleDocsConverter
-
-                # Get OAuth credentials
-                credentials = get_google_credentials()
-
-                # Build Google API services
-                docs_service, drive_service = build_google_services(credentials)
-
-                # Create converter
-                gdocs_converter = GoogleDocsConverter(docs_service, drive_service)
-
-                # Convert (use appropriate method based on file type)
-                if is_html:
-                    # Sanitize HTML first
-                    from app.utils.security import sanitize_html
-                    sanitized_content = sanitize_html(content)
-                    gdocs_result = gdocs_converter.convert_html(
-                        sanitized_content,
-                        f"{base_name} - Converted"
-                    )
-                else:
-                    # Markdown conversion
-                    gdocs_result = gdocs_converter.convert(
-                        content,
-                        f"{base_name} - Converted"
-                    )
-
-                results['gdocs'] = {
-                    'web_view_link': gdocs_result['webViewLink'],
-                    'document_id': gdocs_result['documentId'],
-                    'title': gdocs_result['title'],
-                    'ownership': 'user'  # Document owned by authenticated user
-                }
-                logger.info(f'Successfully converted to Google Docs: {gdocs_result["documentId"]}')
-            except Exception as e:
-                logger.error(f'Google Docs conversion failed: {e}', exc_info=True)
-
-                # Check if rate limit error
-                if 'rate limit' in str(e).lower() or '429' in str(e):
-                    error = format_error_response(
-                        'RATE_LIMIT_EXCEEDED',
-                        'Google Docs conversion temporarily unavailable',
-                        429,
-                        {'retry_after': 60}
-                    )
-                    return jsonify(error), 429
-
-                error = format_error_response(
-                    'CONVERSION_ERROR',
-                    'Failed to convert to Google Docs',
-                    500
-                )
-                return jsonify(error), 500
+            result, error = _convert_gdocs(gdocs_converter, content, is_html, base_name)
+            if error:
+                return jsonify(error), error['status']
+            results['gdocs'] = result
 
         # Build success response
         processing_time = calculate_processing_time(start_time)
@@ -330,7 +278,7 @@ def convert():
             'filename': base_name,
             'formats': results,
             'processing_time': round(processing_time, 2),
-            'timestamp': datetime.utcnow().isoformat() + 'Z'
+            'timestamp': generate_timestamp()
         }
 
         logger.info(f'Successfully converted {base_name} to {len(formats)} format(s) in {processing_time:.2f}s')
@@ -346,6 +294,185 @@ def convert():
         return jsonify(error), 500
 
 
+def _decode_upload(file) -> Tuple[bytes, str]:
+    """
+    Read and decode the uploaded file in a single pass.
+
+    The decode itself rejects non-UTF-8 input, so no separate full-file
+    encoding scan is needed.
+
+    Args:
+        file: FileStorage object
+
+    Returns:
+        Tuple of (raw bytes, decoded content)
+
+    Raises:
+        UnicodeDecodeError: If the file is not valid UTF-8
+    """
+    file.stream.seek(0)
+    raw = file.stream.read()
+    return raw, raw.decode('utf-8')
+
+
+def _convert_docx(converter, content, is_html, docx_path, encryption_key, job_id):
+    """
+    Convert content to an encrypted DOCX file (runs in a worker thread).
+
+    Returns:
+        Tuple of (result dict, None) on success or (None, error dict) on failure
+    """
+    try:
+        if is_html:
+            # HTML conversion (already validated on the request thread)
+            converter.convert_to_docx(content, docx_path, sanitize=False)
+        else:
+            # Markdown conversion
+            converter.convert_to_docx(content, docx_path, include_front_matter=True)
+
+        # Encrypt the file
+        if not encrypt_file_in_place(docx_path, encryption_key):
+            logger.error('Failed to encrypt DOCX file')
+            return None, format_error_response(
+                'ENCRYPTION_ERROR',
+                'Failed to secure converted file',
+                500
+            )
+
+        # Single stat for the encrypted size; the name is already known
+        docx_size = os.path.getsize(docx_path)
+        logger.info(f'Successfully converted and encrypted DOCX: {docx_path}')
+        return {
+            'download_url': f'/api/download/{job_id}/docx',
+            'filename': Path(docx_path).stem,  # Remove extension as it's encrypted
+            'size': docx_size,
+            'size_formatted': format_file_size(docx_size),
+            'mimetype': get_mime_type('docx')
+        }, None
+    except Exception as e:
+        logger.error(f'DOCX conversion failed: {e}', exc_info=True)
+        return None, format_error_response(
+            'CONVERSION_ERROR',
+            'Failed to convert to DOCX',
+            500
+        )
+
+
+def _convert_pdf(converter, content, is_html, pdf_path, encryption_key, job_id):
+    """
+    Convert content to an encrypted PDF file (runs in a worker thread).
+
+    Returns:
+        Tuple of (result dict, None) on success or (None, error dict) on failure
+    """
+    try:
+        if is_html:
+            # HTML conversion (already validated on the request thread)
+            pdf = converter.convert_to_pdf_bytes(content, sanitize=False)
+        else:
+            # Markdown conversion
+            pdf = converter.convert_to_pdf_bytes(content)
+
+        # Encrypt straight from memory; the plaintext PDF never hits disk
+        if not encrypt_to_file(pdf, pdf_path, encryption_key):
+            logger.error('Failed to encrypt PDF file')
+            return None, format_error_response(
+                'ENCRYPTION_ERROR',
+                'Failed to secure converted file',
+                500
+            )
+
+        # Single stat for the encrypted size; the name is already known
+        pdf_size = os.path.getsize(pdf_path)
+        logger.info(f'Successfully converted and encrypted PDF: {pdf_path}')
+        return {
+            'download_url': f'/api/download/{job_id}/pdf',
+            'filename': Path(pdf_path).stem,  # Remove extension as it's encrypted
+            'size': pdf_size,
+            'size_formatted': format_file_size(pdf_size),
+            'mimetype': get_mime_type('pdf')
+        }, None
+    except Exception as e:
+        logger.error(f'PDF conversion failed: {e}', exc_info=True)
+        return None, format_error_response(
+            'CONVERSION_ERROR',
+            'Failed to convert to PDF',
+            500
+        )
+
+
+def _build_gdocs_converter():
+    """
+    Build a GoogleDocsConverter from the current user's OAuth session.
+
+    Must be called from the request thread (reads the Flask-Dance session).
+    """
+    from app.utils.oauth_helpers import get_google_credentials
+    from app.utils.google_services import build_google_services
+    from app.converters.google_docs_converter import GoogleDocsConverter
+
+    # Get OAuth credentials
+    credentials = get_google_credentials()
+
+    # Build Google API services
+    docs_service, drive_service = build_google_services(credentials)
+
+    return GoogleDocsConverter(docs_service, drive_service, credentials)
+
+
+def _convert_gdocs(gdocs_converter, content, is_html, base_name):
+    """
+    Convert content to a Google Doc (runs after the local formats succeed).
+
+    Returns:
+        Tuple of (result dict, None) on success or (None, error dict) on failure
+    """
+    try:
+        # Convert (use appropriate method based on file type)
+        if is_html:
+            # Sanitize HTML first
+            sanitized_content = sanitize_html(content)
+            gdocs_result = gdocs_converter.convert_html(
+                sanitized_content,
+                f"{base_name} - Converted"
+            )
+        else:
+            # Markdown conversion
+            gdocs_result = gdocs_converter.convert(
+                content,
+                f"{base_name} - Converted"
+            )
+
+        logger.info(f'Successfully converted to Google Docs: {gdocs_result["documentId"]}')
+        return {
+            'web_view_link': gdocs_result['webViewLink'],
+            'document_id': gdocs_result['documentId'],
+            'title': gdocs_result['title'],
+            'ownership': 'user'  # Document owned by authenticated user
+        }, None
+    except Exception as e:
+        logger.error(f'Google Docs conversion failed: {e}', exc_info=True)
+        return None, _gdocs_error_response(e)
+
+
+def _gdocs_error_response(e):
+    """Map a Google Docs failure to a rate-limit or generic conversion error."""
+    # Check if rate limit error
+    if 'rate limit' in str(e).lower() or '429' in str(e):
+        return format_error_response(
+            'RATE_LIMIT_EXCEEDED',
+            'Google Docs conversion temporarily unavailable',
+            429,
+            {'retry_after': 60}
+        )
+
+    return format_error_response(
+        'CONVERSION_ERROR',
+        'Failed to convert to Google Docs',
+        500
+    )
+
+
 @api_blueprint.route('/download/<job_id>/<format>', methods=['GET'])
 def download(job_id: str, format: str):
     """
@@ -383,9 +510,11 @@ def download(job_id: str, format: str):
 
     try:
         base_dir = str(current_app.config['CONVERTED_FOLDER'])
+        job_dir = os.path.join(base_dir, job_id)
 
         # Check if job has expired
-        if is_job_expired(job_id, base_dir, max_age_hours=24):
+        retention_hours = current_app.config['JOB_RETENTION_HOURS']
+        if is_job_expired(job_dir, max_age_hours=retention_hours):
             logger.warning(f'Job expired: {job_id}')
             error = format_error_response(
                 'FILE_EXPIRED',
@@ -393,7 +522,7 @@ def download(job_id: str, format: str):
                 410,
                 {
                     'job_id': job_id,
-                    'expiration_policy': '24 hours'
+                    'expiration_policy': f'{retention_hours} hours'
                 }
             )
             return jsonify(error), 410
@@ -401,7 +530,7 @@ def download(job_id: str, format: str):
         # Get file path
         file_path = get_file_path(job_id, format, base_dir)
 
-        if not file_path or not os.path.exists(file_path):
+        if not file_path:
             logger.warning(f'File not found: job_id={job_id}, format={format}')
             error = format_error_response(
                 'FILE_NOT_FOUND',
@@ -439,17 +568,19 @@ def download(job_id: str, format: str):
             return jsonify(error), 500
 
         # Get original filename
-        file_info = get_file_info(file_path)
-        original_filename = f'{Path(file_info["filename"]).stem}.{format}'
+        original_filename = f'{Path(file_path).stem}.{format}'
 
         logger.info(f'Serving decrypted file: {original_filename} ({len(decrypted_content)} bytes)')
 
         # Send decrypted file from memory
+        # (decrypted in memory, so X-Sendfile cannot apply here; conditional
+        # still enables Range requests)
         return send_file(
             io.BytesIO(decrypted_content),
             as_attachment=True,
             download_name=original_filename,
-            mimetype=get_mime_type(format)
+            mimetype=get_mime_type(format),
+            conditional=True
         )
 
     except ValueError as e:
@@ -472,7 +603,7 @@ def download(job_id: str, format: str):
         return jsonify(error), 500
 
 
-def handle_legacy_single_format(file, format_type, base_name):
+def handle_legacy_single_format(content, format_type, base_name, is_html):
     """
     Handle legacy single format conversion (direct file download).
 
@@ -480,9 +611,10 @@ def handle_legacy_single_format(file, format_type, base_name):
     that expect direct file download instead of JSON response.
 
     Args:
-        file: FileStorage object
+        content: Decoded upload content
         format_type: Format string ('docx' or 'pdf')
         base_name: Base filename without extension
+        is_html: Whether the upload is HTML (otherwise markdown)
 
     Returns:
         Binary file response
@@ -490,19 +622,6 @@ def handle_legacy_single_format(file, format_type, base_name):
     Raises:
         Exception: If conversion fails
     """
-    # Reset file pointer
-    file.seek(0)
-
-    try:
-        content = file.read().decode('utf-8')
-    except UnicodeDecodeError:
-        error = format_error_response(
-            'INVALID_ENCODING',
-            'File must be UTF-8 encoded',
-            422
-        )
-        return jsonify(error), 422
-
     # Generate job ID
     job_id = generate_job_id()
     job_dir = get_job_directory(job_id, str(current_app.config['CONVERTED_FOLDER']))
@@ -510,11 +629,8 @@ def handle_legacy_single_format(file, format_type, base_name):
     # Generate encryption key (not needed for legacy mode as file is returned immediately)
     # But we'll still encrypt in case of errors and need to clean up later
 
-    # Detect file type
-    file_ext = Path(file.filename).suffix.lower()
-    is_html = file_ext in ['.html', '.htm']
-
     # Initialize appropriate converter
+    from app.converters import MarkdownConverter, HtmlConverter
     if is_html:
         converter = HtmlConverter()
     else:
@@ -537,12 +653,13 @@ def handle_legacy_single_format(file, format_type, base_name):
 
     logger.info(f'Legacy conversion completed: {output_path}')
 
-    # Return file directly
+    # Return file directly (offloaded to the web server when USE_X_SENDFILE is set)
     return send_file(
         output_path,
         as_attachment=True,
         download_name=f'{base_name}.{format_type}',
-        mimetype=get_mime_type(format_type)
+        mimetype=get_mime_type(format_type),
+        conditional=True
     )
 
 
@@ -554,29 +671,28 @@ def cleanup():
     This endpoint is protected and should only be called by administrators
     or scheduled tasks. In production, use a proper authentication mechanism.
 
+    The cleanup itself runs on the background scheduler; this endpoint only
+    moves the next scheduled run to now and returns immediately.
+
     Returns:
-        JSON with cleanup statistics
+        JSON confirming the cleanup was scheduled (202)
     """
     # TODO: Add authentication for this endpoint in production
 
     try:
-        base_dir = str(current_app.config['CONVERTED_FOLDER'])
-        max_age_hours = current_app.config.get('CLEANUP_INTERVAL', 24 * 3600) // 3600
+        scheduler = current_app.extensions['scheduler']
+        scheduler.get_job('cleanup').modify(next_run_time=datetime.now())
 
-        logger.info(f'Starting manual cleanup (max_age={max_age_hours}h)')
-
-        deleted_count = cleanup_old_files(base_dir, max_age_hours)
+        logger.info('Manual cleanup scheduled')
 
         response = {
-            'status': 'success',
-            'message': f'Cleanup completed',
-            'deleted_directories': deleted_count,
-            'max_age_hours': max_age_hours,
-            'timestamp': datetime.utcnow().isoformat() + 'Z'
+            'status': 'scheduled',
+            'message': 'Cleanup scheduled',
+            'max_age_hours': current_app.config['JOB_RETENTION_HOURS'],
+            'timestamp': generate_timestamp()
         }
 
-        logger.info(f'Cleanup completed: {deleted_count} directories deleted')
-        return jsonify(response), 200
+        return jsonify(response), 202
 
     except Exception as e:
         logger.error(f'Cleanup failed: {e}', exc_info=True)
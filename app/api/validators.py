@@ -11,14 +11,65 @@ This module provides request validation logic including:
 Used by: app/api/routes.py for validating incoming requests
 """
 import logging
+import re
+from types import MappingProxyType
 from flask import current_app, Request
 from typing import Optional, Dict, Any
-from pathlib import Path
-from app.utils.security import check_allowed_extension
-
+from app.config import Config
 
 logger = logging.getLogger(__name__)
 
+# Allowed upload extensions, resolved once at import
+ALLOWED_EXTENSIONS = Config.ALLOWED_EXTENSIONS
+
+# Same set as dotted suffixes, for a single str.endswith check
+_ALLOWED_SUFFIXES = tuple(sorted(f'.{ext}' for ext in ALLOWED_EXTENSIONS))
+
+# Canonical 8-4-4-4-12 hex UUID (the form generate_job_id produces)
+_UUID_RE = re.compile(
+    r'\A[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\Z'
+)
+
+# Static error payloads, built once; responses get a copy with any
+# variable fields filled in
+_INVALID_FILE_TYPE_ERROR = MappingProxyType({
+    'error': 'Invalid file type. Allowed types: .md, .markdown, .txt, .html, .htm',
+    'code': 'INVALID_FILE_TYPE',
+    'status': 415,
+    'allowed_types': ('.md', '.markdown', '.txt', '.html', '.htm')
+})
+_INVALID_FORMAT_ERROR = MappingProxyType({
+    'error': 'Invalid format. Allowed formats: docx, pdf, both',
+    'code': 'INVALID_FORMAT',
+    'status': 400,
+    'allowed_formats': ('docx', 'pdf', 'both')
+})
+_MISSING_FILE_ERROR = MappingProxyType({
+    'error': 'No file provided in request',
+    'code': 'MISSING_FILE',
+    'status': 400
+})
+_EMPTY_FILENAME_ERROR = MappingProxyType({
+    'error': 'No file selected',
+    'code': 'EMPTY_FILENAME',
+    'status': 400
+})
+_INVALID_JOB_ID_ERROR = MappingProxyType({
+    'error': 'Invalid job ID format',
+    'code': 'INVALID_JOB_ID',
+    'status': 400
+})
+_BINARY_CONTENT_ERROR = MappingProxyType({
+    'error': 'File appears to contain binary data',
+    'code': 'BINARY_CONTENT',
+    'status': 422
+})
+_EMPTY_CONTENT_ERROR = MappingProxyType({
+    'error': 'File is empty',
+    'code': 'EMPTY_CONTENT',
+    'status': 422
+})
+
 
 def validate_upload(request: Request) -> Optional[Dict[str, Any]]:
     """
@@ -44,36 +95,21 @@ def validate_upload(request: Request) -> Optional[Dict[str, Any]]:
     # Check file presence
     if 'file' not in request.files:
         logger.warning('No file in request')
-        return {
-            'error': 'No file provided in request',
-            'code': 'MISSING_FILE',
-            'status': 400
-        }
+        return dict(_MISSING_FILE_ERROR)
 
     file = request.files['file']
 
     # Check filename
     if not file.filename or file.filename == '':
         logger.warning('Empty filename')
-        return {
-            'error': 'No file selected',
-            'code': 'EMPTY_FILENAME',
-            'status': 400
-        }
-
-    # Validate file type
-    allowed_extensions = current_app.config.get('ALLOWED_EXTENSIONS', {'md', 'markdown', 'txt', 'html', 'htm'})
-
-    if not check_allowed_extension(file.filename, allowed_extensions):
-        ext = Path(file.filename).suffix
-        logger.warning(f'Invalid file type: {ext}')
-        return {
-            'error': 'Invalid file type. Allowed types: .md, .markdown, .txt, .html, .htm',
-            'code': 'INVALID_FILE_TYPE',
-            'status': 415,
-            'allowed_types': ['.md', '.markdown', '.txt', '.html', '.htm'],
-            'received_type': ext
-        }
+        return dict(_EMPTY_FILENAME_ERROR)
+
+    # Validate file type - one C-level suffix match, no split or set hash
+    if not file.filename.lower().endswith(_ALLOWED_SUFFIXES):
+        dot = file.filename.rfind('.')
+        ext = file.filename[dot:] if dot >= 0 else ''
+        logger.warning('Invalid file type: %s', ext)
+        return {**_INVALID_FILE_TYPE_ERROR, 'received_type': ext}
 
     # Validate format parameter if provided
     format_param = request.form.get('format', 'both')
@@ -84,25 +120,30 @@ def validate_upload(request: Request) -> Optional[Dict[str, Any]]:
     # File size is automatically checked by Flask's MAX_CONTENT_LENGTH
     # But we can add additional logging
     try:
-        file.seek(0, 2)  # Seek to end
-        file_size = file.tell()
-        file.seek(0)  # Reset to start
-
         max_size = current_app.config.get('MAX_FILE_SIZE', 10 * 1024 * 1024)
-        if file_size > max_size:
-            logger.warning(f'File too large: {file_size} bytes (max: {max_size})')
-            return {
-                'error': f'File size exceeds maximum limit of {max_size} bytes',
-                'code': 'FILE_TOO_LARGE',
-                'status': 413,
-                'max_size': max_size,
-                'uploaded_size': file_size
-            }
-
-        logger.debug(f'File validation passed: {file.filename} ({file_size} bytes)')
+
+        # The request body bounds the file size, so a body within the limit
+        # needs no seek; only measure the file itself when it might be over
+        body_size = request.content_length
+        if body_size is None or body_size > max_size:
+            file.seek(0, 2)  # Seek to end
+            file_size = file.tell()
+            file.seek(0)  # Reset to start
+
+            if file_size > max_size:
+                logger.warning('File too large: %d bytes (max: %d)', file_size, max_size)
+                return {
+                    'error': f'File size exceeds maximum limit of {max_size} bytes',
+                    'code': 'FILE_TOO_LARGE',
+                    'status': 413,
+                    'max_size': max_size,
+                    'uploaded_size': file_size
+                }
+
+        logger.debug('File validation passed: %s (request body %s bytes)', file.filename, body_size)
 
     except Exception as e:
-        logger.error(f'Error checking file size: {e}')
+        logger.error('Error checking file size: %s', e)
 
     return None  # Valid
 
@@ -122,17 +163,9 @@ def validate_format(format_str: str) -> Optional[Dict[str, Any]]:
         >>> if error is None:
         >>>     # Format is valid
     """
-    allowed_formats = ['docx', 'pdf', 'both']
-
-    if format_str not in allowed_formats:
-        logger.warning(f'Invalid format: {format_str}')
-        return {
-            'error': 'Invalid format. Allowed formats: docx, pdf, both',
-            'code': 'INVALID_FORMAT',
-            'status': 400,
-            'allowed_formats': allowed_formats,
-            'received_format': format_str
-        }
+    if format_str not in _INVALID_FORMAT_ERROR['allowed_formats']:
+        logger.warning('Invalid format: %s', format_str)
+        return {**_INVALID_FORMAT_ERROR, 'received_format': format_str}
 
     return None
 
@@ -147,82 +180,40 @@ def validate_job_id(job_id: str) -> Optional[Dict[str, Any]]:
     Returns:
         Error dictionary if invalid, None if valid
     """
-    import uuid
-
-    try:
-        uuid.UUID(job_id)
-        return None  # Valid
-    except (ValueError, AttributeError) as e:
-        logger.warning(f'Invalid job ID format: {job_id}')
-        return {
-            'error': 'Invalid job ID format',
-            'code': 'INVALID_JOB_ID',
-            'status': 400
-        }
-
-
-def validate_content_encoding(file) -> Optional[Dict[str, Any]]:
-    """
-    Validate file content is UTF-8 encoded text.
-
-    Args:
-        file: File object from request
-
-    Returns:
-        Error dictionary if invalid, None if valid
-    """
-    try:
-        # Try to read and decode as UTF-8
-        content = file.read()
-        content.decode('utf-8')
-        file.seek(0)  # Reset file pointer
+    # Job IDs are always issued as canonical str(uuid4()), so the pattern
+    # match is the whole check - no uuid.UUID parse or exception needed
+    if isinstance(job_id, str) and _UUID_RE.match(job_id):
         return None  # Valid
 
-    except UnicodeDecodeError:
-        logger.warning('File encoding error - not UTF-8')
-        file.seek(0)  # Reset file pointer
-        return {
-            'error': 'File must be UTF-8 encoded text',
-            'code': 'INVALID_ENCODING',
-            'status': 422
-        }
-    except Exception as e:
-        logger.error(f'Error validating encoding: {e}')
-        file.seek(0)  # Reset file pointer
-        return {
-            'error': 'Failed to read file',
-            'code': 'FILE_READ_ERROR',
-            'status': 500
-        }
+    logger.warning('Invalid job ID format: %s', job_id)
+    return dict(_INVALID_JOB_ID_ERROR)
 
 
-def validate_markdown_content(content: str) -> Optional[Dict[str, Any]]:
+def validate_markdown_content(
+    content: str,
+    raw: Optional[bytes] = None
+) -> Optional[Dict[str, Any]]:
     """
     Validate markdown content is safe and parseable.
 
     Args:
         content: Markdown content string
+        raw: Undecoded bytes of content, if available. The null-byte scan
+            then runs on the bytes (a plain memchr) instead of the str.
 
     Returns:
         Error dictionary if invalid, None if valid
     """
     # Check for null bytes (binary content)
-    if '\x00' in content:
+    if (raw.find(b'\x00') if raw is not None else content.find('\x00')) != -1:
         logger.warning('Binary content detected in markdown file')
-        return {
-            'error': 'File appears to contain binary data',
-            'code': 'BINARY_CONTENT',
-            'status': 422
-        }
-
-    # Check minimum length
-    if len(content.strip()) == 0:
+        return dict(_BINARY_CONTENT_ERROR)
+
+    # Check minimum length (isspace stops at the first non-whitespace
+    # character instead of copying the whole stripped string)
+    if not content or content.isspace():
         logger.warning('Empty markdown content')
-        return {
-            'error': 'File is empty',
-            'code': 'EMPTY_CONTENT',
-            'status': 422
-        }
+        return dict(_EMPTY_CONTENT_ERROR)
 
     # Content is valid
     return None
@@ -244,5 +235,4 @@ def allowed_file(filename: str) -> bool:
         >>> allowed_file('document.exe')
         False
     """
-    allowed_extensions = current_app.config.get('ALLOWED_EXTENSIONS', {'md', 'markdown', 'txt', 'html', 'htm'})
-    return check_allowed_extension(filename, allowed_extensions)
+    return filename.lower().endswith(_ALLOWED_SUFFIXES)
@@ -15,14 +15,94 @@ Dependencies:
 Used by: Frontend JavaScript for auth status checks
 """
 from flask import redirect, url_for, flash, jsonify, session
-from flask_dance.contrib.google import google
+import hashlib
 import logging
-import requests
+import threading
+import time
 
 from app.auth import auth_bp
 
 logger = logging.getLogger(__name__)
 
+# Flask-Dance google proxy and the token revocation session are created on
+# first use, so requests/oauthlib are not imported until an /auth route runs
+_google = None
+_revoke_session = None
+_revoke_session_lock = threading.Lock()
+
+
+def _get_google():
+    """Get the Flask-Dance google proxy, importing Flask-Dance on first use."""
+    global _google
+    if _google is None:
+        from flask_dance.contrib.google import google
+        _google = google
+    return _google
+
+
+def _get_revoke_session():
+    """
+    Get the pooled keep-alive session used for token revocation.
+
+    Reuses the TLS connection to oauth2.googleapis.com across logouts.
+    """
+    global _revoke_session
+    if _revoke_session is None:
+        with _revoke_session_lock:
+            if _revoke_session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                revoke_session = requests.Session()
+                revoke_session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
+                _revoke_session = revoke_session
+    return _revoke_session
+
+
+# How long a fetched Google userinfo payload is served from the session
+USERINFO_CACHE_TTL = 300  # seconds
+
+
+def _get_user_info():
+    """
+    Get the signed-in user's Google profile, cached in the session.
+
+    The cached copy is reused until USERINFO_CACHE_TTL elapses or the OAuth
+    token expires, whichever comes first. It is tied to a digest of the
+    access token it was fetched with, so signing in with another account
+    (a new token) misses the cache.
+
+    Returns:
+        Userinfo dictionary, or None if the fetch failed
+
+    Raises:
+        Exception: If the request to Google fails
+    """
+    now = time.time()
+    google = _get_google()
+    access_token = (google.token or {}).get('access_token') or ''
+    token_digest = hashlib.sha256(access_token.encode('utf-8')).hexdigest()
+
+    user_info = session.get('userinfo')
+    if (user_info and session.get('userinfo_exp', 0) > now
+            and session.get('userinfo_token') == token_digest):
+        return user_info
+
+    resp = google.get('/oauth2/v2/userinfo')
+    if not resp.ok:
+        logger.warning(f"Failed to fetch user info: {resp.status_code}")
+        return None
+
+    user_info = resp.json()
+    expires = now + USERINFO_CACHE_TTL
+    token_expires_at = (google.token or {}).get('expires_at')
+    if token_expires_at:
+        expires = min(expires, token_expires_at)
+
+    session['userinfo'] = user_info
+    session['userinfo_exp'] = expires
+    session['userinfo_token'] = token_digest
+    return user_info
+
 
 @auth_bp.route('/status')
 def status():
@@ -51,12 +131,12 @@ def status():
         ... .then(res => res.json())
         ... .then(data => console.log(data.authenticated))
     """
+    google = _get_google()
     if google.authorized:
         try:
-            # Fetch user info from Google
-            resp = google.get('/oauth2/v2/userinfo')
-            if resp.ok:
-                user_info = resp.json()
+            # Fetch user info from Google (served from the session when fresh)
+            user_info = _get_user_info()
+            if user_info:
                 logger.debug(f"Auth status check: authenticated as {user_info.get('email')}")
                 return jsonify({
                     'authenticated': True,
@@ -66,8 +146,6 @@ def status():
                         'picture': user_info.get('picture')
                     }
                 }), 200
-            else:
-                logger.warning(f"Failed to fetch user info: {resp.status_code}")
         except Exception as e:
             logger.error(f"Failed to fetch user info: {e}", exc_info=True)
 
@@ -90,28 +168,43 @@ def logout():
         >>> curl http://localhost:8080/auth/logout
         [Redirects to /]
     """
+    google = _get_google()
     if google.authorized:
         token = google.token.get('access_token')
 
-        # Optional: Revoke token with Google
+        # Optional: Revoke token with Google (in the background - the
+        # user never sees the result, so don't hold up the redirect)
         if token:
-            try:
-                requests.post(
-                    'https://oauth2.googleapis.com/revoke',
-                    params={'token': token},
-                    headers={'content-type': 'application/x-www-form-urlencoded'}
-                )
-                logger.info("OAuth token revoked successfully")
-            except Exception as e:
-                logger.warning(f"Token revocation failed: {e}")
-
-    # Clear Flask session
+            threading.Thread(target=_revoke_token, args=(token,), daemon=True).start()
+
+    # Clear Flask session (including the cached userinfo)
     session.clear()
 
     logger.info("User signed out")
     return redirect('/')
 
 
+def _revoke_token(token):
+    """
+    Revoke an OAuth access token with Google.
+
+    Runs on a background thread started by logout().
+
+    Args:
+        token: OAuth access token to revoke
+    """
+    try:
+        _get_revoke_session().post(
+            'https://oauth2.googleapis.com/revoke',
+            params={'token': token},
+            headers={'content-type': 'application/x-www-form-urlencoded'},
+            timeout=10
+        )
+        logger.info("OAuth token revoked successfully")
+    except Exception as e:
+        logger.warning(f"Token revocation failed: {e}")
+
+
 @auth_bp.route('/profile')
 def profile():
     """
@@ -136,15 +229,16 @@ def profile():
             "verified_email": true
         }
     """
+    google = _get_google()
     if not google.authorized:
         return jsonify({'error': 'Not authenticated'}), 401
 
     try:
-        resp = google.get('/oauth2/v2/userinfo')
-        if resp.ok:
-            return jsonify(resp.json()), 200
+        user_info = _get_user_info()
+        if user_info:
+            return jsonify(user_info), 200
         else:
-            return jsonify({'error': 'Failed to fetch user info'}), resp.status_code
+            return jsonify({'error': 'Failed to fetch user info'}), 502
     except Exception as e:
         logger.error(f"Profile fetch error: {e}", exc_info=True)
         return jsonify({'error': 'Internal server error'}), 500
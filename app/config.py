@@ -9,6 +9,32 @@ Used by: app/__init__.py for application configuration
 """
 import os
 from pathlib import Path
+from typing import Optional
+
+
+def _get_secret_key() -> Optional[str]:
+    """
+    Resolve the Flask secret key shared by all workers.
+
+    Reads the SECRET_KEY environment variable, then the file named by
+    SECRET_KEY_FILE (default: /run/secrets/flask_secret). A per-process
+    random fallback is deliberately not provided: each worker would sign
+    sessions with a different key and users would be logged out whenever
+    a request landed on a sibling worker.
+
+    Returns:
+        Secret key string, or None if not configured
+    """
+    secret_key = os.environ.get('SECRET_KEY')
+    if secret_key:
+        return secret_key
+
+    secret_file = os.environ.get('SECRET_KEY_FILE', '/run/secrets/flask_secret')
+    try:
+        with open(secret_file, 'r') as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
 
 
 class Config:
@@ -19,7 +45,7 @@ class Config:
 
     # Application settings
     MAX_FILE_SIZE = int(os.environ.get('MAX_FILE_SIZE', 10 * 1024 * 1024))  # 10MB
-    ALLOWED_EXTENSIONS = {'md', 'markdown', 'txt', 'html', 'htm'}
+    ALLOWED_EXTENSIONS = frozenset({'md', 'markdown', 'txt', 'html', 'htm'})
     MAX_CONTENT_LENGTH = MAX_FILE_SIZE
 
     # HTML conversion settings
@@ -33,13 +59,23 @@ class Config:
     CONVERTED_FOLDER = Path(os.environ.get('CONVERTED_FOLDER', '/tmp/converted'))
     TEMPLATE_PATH = BASE_DIR / 'app' / 'templates' / 'template.docx'
 
+    # Let a fronting web server (Apache mod_xsendfile, or nginx mapping
+    # X-Sendfile to an internal X-Accel-Redirect location) stream files
+    # served from disk with sendfile(2) instead of reading them through Python
+    USE_X_SENDFILE = os.environ.get('USE_X_SENDFILE', 'False').lower() == 'true'
+
     # Conversion settings
     INCLUDE_FRONT_MATTER = True
-    CLEANUP_INTERVAL = 24 * 3600  # 24 hours in seconds
+    # How long converted jobs are kept: the background cleanup deletes them
+    # and downloads report them expired after this many hours
+    JOB_RETENTION_HOURS = 1
 
     # Logging
     LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO')
 
+    # Log startup diagnostics (dependency versions, folders, routes) per worker
+    STARTUP_DIAG = os.environ.get('STARTUP_DIAG', 'False').lower() == 'true'
+
     # OAuth2 configuration
     GOOGLE_OAUTH_CLIENT_ID = os.environ.get('GOOGLE_OAUTH_CLIENT_ID')
     GOOGLE_OAUTH_CLIENT_SECRET = os.environ.get('GOOGLE_OAUTH_CLIENT_SECRET')
@@ -70,11 +106,9 @@ class ProductionConfig(Config):
     DEBUG = False
     LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO')
 
-    # Production secret key should be set via environment variable
-    SECRET_KEY = os.environ.get('SECRET_KEY')
-    if not SECRET_KEY:
-        import secrets
-        SECRET_KEY = secrets.token_hex(32)
+    # Production secret key must be set via environment variable or secret
+    # file (create_app refuses to start without one)
+    SECRET_KEY = _get_secret_key()
 
 
 class TestingConfig(Config):
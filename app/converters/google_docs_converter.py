@@ -7,42 +7,437 @@ using the Google Docs API v1.
 
 Dependencies:
     - google-api-python-client: Google API client
-    - markgdoc: Markdown to Google Docs conversion (optional)
-    - python-frontmatter: YAML front matter parsing
+    - PyYAML: YAML front matter parsing (libyaml C loader when available)
     - beautifulsoup4: HTML parsing
+    - lxml: Fast parser backend for BeautifulSoup (optional)
     - requests: Image downloading
 
 Used by: app/api/routes.py for Google Docs conversion requests
 """
-import frontmatter
+import hashlib
 import logging
+import random
+import re
+import threading
 import time
 import io
 import requests
-from typing import Dict, Tuple, Optional, List
+import yaml
+import google_auth_httplib2
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Iterator, Tuple, Optional, List
 from googleapiclient.discovery import Resource
 from googleapiclient.errors import HttpError
-from googleapiclient.http import MediaIoBaseUpload
+from googleapiclient.http import MediaIoBaseUpload, build_http
 from bs4 import BeautifulSoup
 from app.utils.security import validate_image_url
 
-# Optional: markgdoc for simplified conversion
+# Optional: lxml as the (much faster) BeautifulSoup parser backend
 try:
-    import markgdoc
-    MARKGDOC_AVAILABLE = True
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
 except ImportError:
-    MARKGDOC_AVAILABLE = False
-    logging.warning("markgdoc not installed - using custom markdown parser")
+    HTML_PARSER = 'html.parser'
 
 
 logger = logging.getLogger(__name__)
 
+# libyaml-backed loader when PyYAML was built with it (several times faster)
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Front matter delimiter line (same rule as python-frontmatter)
+_FRONT_MATTER_BOUNDARY_RE = re.compile(r'^-{3,}\s*$', re.MULTILINE)
+
+# Concurrent image downloads per HTML conversion
+_IMAGE_FETCH_WORKERS = 8
+
+# Pooled keep-alive HTTP session for image downloads, shared by all
+# converter instances so TLS connections are reused across conversions
+_image_http = requests.Session()
+_image_http.mount('https://', HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+))
+
+# Concurrent Drive image uploads per HTML conversion (kept low to stay
+# within Drive's per-user write quota)
+_IMAGE_UPLOAD_WORKERS = 4
+
+# Image download limits
+_MAX_IMAGE_SIZE = 10 * 1024 * 1024  # 10MB
+_IMAGE_CHUNK_SIZE = 64 * 1024
+
+# Images up to this size are uploaded to Drive in one multipart request;
+# larger ones use a resumable session
+_RESUMABLE_UPLOAD_THRESHOLD = 5 * 1024 * 1024
+
+# Drive MIME type for native Google Docs files
+_GOOGLE_DOCS_MIME_TYPE = 'application/vnd.google-apps.document'
+
+# Heading elements the HTML walk maps to HEADING_n paragraph styles
+_HEADING_TAGS = frozenset(('h1', 'h2', 'h3', 'h4', 'h5', 'h6'))
+
+# Block elements the HTML walk flattens to plain text (images inside are dropped)
+_TEXT_BLOCK_TAGS = ['p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6']
+
+# Google API statuses worth retrying, and the backoff delays (seconds).
+# Rate limits are rejected before anything is written, so every call retries
+# them; a server error can arrive after the write was applied, so only
+# idempotent calls retry those.
+_RATE_LIMIT_STATUSES = frozenset((429,))
+_SERVER_ERROR_STATUSES = frozenset((500, 502, 503, 504))
+_RETRY_BASE_DELAY = 1.0
+_RETRY_MAX_DELAY = 60.0
+
+# Requests per batchUpdate call, kept under the Docs API's 500 ceiling
+_MAX_BATCH_REQUESTS = 450
+
+# Parsed front matter and body requests of recent markdown submissions,
+# keyed by content digest (LRU; larger bodies are not cached)
+_BUILD_CACHE_SIZE = 32
+_BUILD_CACHE_MAX_CHARS = 256 * 1024
+_build_cache: 'OrderedDict[bytes, Tuple[Dict, List[dict]]]' = OrderedDict()
+_build_cache_lock = threading.Lock()
+
+# Heading pattern used by the custom parser, compiled once (emphasis is
+# scanned with str.find, see _bold_spans/_italic_spans)
+_HEADING_RE = re.compile(r'^(#{1,6})\s+(.+)$')
+
+# Whitespace-only lines, which the parser emits as bare paragraph breaks
+_BLANK_LINE_RE = re.compile(r'^[^\S\n]+$', re.MULTILINE)
+
+
+# Shared style payloads for the request factories below (never mutated)
+_HEADING_STYLES = {level: {'namedStyleType': f'HEADING_{level}'} for level in range(1, 7)}
+_BOLD_STYLE = {'bold': True}
+_ITALIC_STYLE = {'italic': True}
+_TITLE_STYLE = {'namedStyleType': 'TITLE'}
+_SUBTITLE_STYLE = {'namedStyleType': 'SUBTITLE'}
+_HEADER_TEXT_STYLE = {'fontSize': {'magnitude': 10, 'unit': 'PT'}}
+
 
 class GoogleDocsConversionError(Exception):
     """Raised when Google Docs conversion fails."""
     pass
 
 
+def _u16_len(text: str) -> int:
+    """
+    Length of text in UTF-16 code units, the unit Docs API indices count.
+
+    Characters outside the Basic Multilingual Plane (e.g. emoji) take two
+    units, so len() would misplace every index after them.
+
+    Args:
+        text: String to measure
+
+    Returns:
+        Number of UTF-16 code units
+    """
+    if text.isascii():
+        return len(text)
+    return len(text.encode('utf-16-le', 'surrogatepass')) >> 1
+
+
+def _u16_span(text: str, start: int, end: int) -> Tuple[int, int]:
+    """
+    Convert a [start, end) slice of text to UTF-16 code unit offsets.
+
+    Args:
+        text: String the offsets index into
+        start: Start offset in code points
+        end: End offset in code points
+
+    Returns:
+        Tuple of (start, end) offsets
+    """
+    if text.isascii():
+        return start, end
+    return _u16_len(text[:start]), _u16_len(text[:end])
+
+
+@lru_cache(maxsize=256)
+def _format_metadata_key(key: str) -> str:
+    """
+    Format a front matter key for display (e.g. 'due_date' -> 'Due Date').
+
+    Documents tend to reuse the same handful of keys, so results are cached.
+
+    Args:
+        key: Front matter key
+
+    Returns:
+        Display label for the key
+    """
+    return key.replace('_', ' ').title()
+
+
+def _bold_spans(line: str) -> List[Tuple[int, int]]:
+    """
+    Find bold spans (**text** or __text__) in a single line.
+
+    Yields the same spans as re.finditer(r'\*\*(.+?)\*\*|__(.+?)__', line)
+    using str.find for the delimiters instead of the regex engine.
+
+    Args:
+        line: One line of markdown (no newlines)
+
+    Returns:
+        List of (start, end) offsets, markers included, in line order
+    """
+    spans = []
+    find = line.find
+    pos = 0
+    # Once a marker has no opener with a closer after it, no later one can
+    star = underscore = True
+
+    while star or underscore:
+        star_start = find('**', pos) if star else -1
+        if star_start != -1:
+            star_close = find('**', star_start + 3)
+            if star_close == -1:
+                star_start = -1
+        if star_start == -1:
+            star = False
+
+        underscore_start = find('__', pos) if underscore else -1
+        if underscore_start != -1:
+            underscore_close = find('__', underscore_start + 3)
+            if underscore_close == -1:
+                underscore_start = -1
+        if underscore_start == -1:
+            underscore = False
+
+        if star_start == -1 and underscore_start == -1:
+            break
+        if underscore_start == -1 or (star_start != -1 and star_start < underscore_start):
+            spans.append((star_start, star_close + 2))
+            pos = star_close + 2
+        else:
+            spans.append((underscore_start, underscore_close + 2))
+            pos = underscore_close + 2
+
+    return spans
+
+
+def _next_italic_span(line: str, marker: str, pos: int) -> Optional[Tuple[int, int]]:
+    """
+    Find the first single-marker italic span starting at or after pos.
+
+    A span opens on a marker not preceded by another marker, encloses at
+    least one non-marker character, and closes on the next marker provided
+    it is not followed by another marker.
+
+    Args:
+        line: One line of markdown (no newlines)
+        marker: '*' or '_'
+        pos: Offset to search from
+
+    Returns:
+        (start, end) offsets, markers included, or None if there is none
+    """
+    find = line.find
+    start = find(marker, pos)
+    while start != -1:
+        if start == 0 or line[start - 1] != marker:
+            close = find(marker, start + 1)
+            if close == -1:
+                return None
+            if close > start + 1 and line[close + 1:close + 2] != marker:
+                return start, close + 1
+        start = find(marker, start + 1)
+    return None
+
+
+def _italic_spans(line: str) -> List[Tuple[int, int]]:
+    """
+    Find italic spans (*text* or _text_) in a single line.
+
+    Yields the same spans as
+    re.finditer(r'(?<!\*)\*([^*]+?)\*(?!\*)|(?<!_)_([^_]+?)_(?!_)', line)
+    using str.find instead of the regex engine's lookarounds.
+
+    Args:
+        line: One line of markdown (no newlines)
+
+    Returns:
+        List of (start, end) offsets, markers included, in line order
+    """
+    spans = []
+    pos = 0
+    while True:
+        star = _next_italic_span(line, '*', pos)
+        underscore = _next_italic_span(line, '_', pos)
+        if star is None and underscore is None:
+            return spans
+        if underscore is None or (star is not None and star[0] < underscore[0]):
+            span = star
+        else:
+            span = underscore
+        spans.append(span)
+        pos = span[1]
+
+
+def _iter_lines(text: str) -> Iterator[str]:
+    """
+    Yield the lines of text one at a time.
+
+    Yields the same lines as text.split('\n') without building the whole
+    list up front.
+
+    Args:
+        text: Text to split on '\n'
+
+    Yields:
+        Each line, without its newline
+    """
+    find = text.find
+    pos = 0
+    while True:
+        end = find('\n', pos)
+        if end == -1:
+            yield text[pos:]
+            return
+        yield text[pos:end]
+        pos = end + 1
+
+
+def _merge_adjacent_spans(spans: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """
+    Merge spans that end exactly where the next one starts.
+
+    Back-to-back spans (e.g. "**a****b**") get one style request for the
+    combined range instead of one each.
+
+    Args:
+        spans: (start, end) offsets in line order, non-overlapping
+
+    Returns:
+        List of merged (start, end) offsets
+    """
+    merged = []
+    for start, end in spans:
+        if merged and merged[-1][1] == start:
+            merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def _build_cache_key(markdown_content: str) -> Optional[bytes]:
+    """
+    Digest identifying markdown_content in the build cache.
+
+    Args:
+        markdown_content: Raw markdown submitted for conversion
+
+    Returns:
+        16-byte digest, or None if the content is too large to cache
+    """
+    if len(markdown_content) > _BUILD_CACHE_MAX_CHARS:
+        return None
+    return hashlib.blake2b(
+        markdown_content.encode('utf-8', 'surrogatepass'), digest_size=16
+    ).digest()
+
+
+def _get_cached_build(key: bytes) -> Optional[Tuple[Dict, List[dict]]]:
+    """
+    Look up a cached (metadata, body requests) pair and mark it recently used.
+
+    The returned objects are shared between conversions and must not be
+    mutated.
+    """
+    with _build_cache_lock:
+        entry = _build_cache.get(key)
+        if entry is not None:
+            _build_cache.move_to_end(key)
+        return entry
+
+
+def _store_cached_build(key: bytes, metadata: Dict, requests: List[dict]) -> None:
+    """Cache a (metadata, body requests) pair, evicting the least recently used."""
+    with _build_cache_lock:
+        _build_cache[key] = (metadata, requests)
+        _build_cache.move_to_end(key)
+        while len(_build_cache) > _BUILD_CACHE_SIZE:
+            _build_cache.popitem(last=False)
+
+
+def _coalesce_insert_requests(requests: List[dict]) -> List[dict]:
+    """
+    Merge runs of adjacent insertText requests into single inserts.
+
+    Two inserts merge when the second starts exactly where the first one's
+    text ends in the same segment. Style requests use absolute indices,
+    so they stay valid unchanged.
+
+    Args:
+        requests: Docs API request dicts in application order
+
+    Returns:
+        List of request dicts with adjacent inserts merged
+    """
+    merged = []
+    run_location = None  # Location of the pending insert run
+    run_texts = []
+    run_end = 0
+
+    def flush():
+        if run_location is not None:
+            merged.append({'insertText': {'location': run_location, 'text': ''.join(run_texts)}})
+
+    for request in requests:
+        insert = request.get('insertText')
+        if insert is None:
+            flush()
+            run_location = None
+            merged.append(request)
+            continue
+
+        location = insert['location']
+        if (run_location is not None
+                and location['index'] == run_end
+                and location.get('segmentId') == run_location.get('segmentId')):
+            run_texts.append(insert['text'])
+        else:
+            flush()
+            run_location = location
+            run_texts = [insert['text']]
+            run_end = location['index']
+        run_end += _u16_len(insert['text'])
+
+    flush()
+    return merged
+
+
+def _paragraph_style_request(start: int, end: int, paragraph_style: dict) -> dict:
+    """Build an updateParagraphStyle request setting namedStyleType on [start, end)."""
+    return {
+        'updateParagraphStyle': {
+            'range': {'startIndex': start, 'endIndex': end},
+            'paragraphStyle': paragraph_style,
+            'fields': 'namedStyleType'
+        }
+    }
+
+
+def _text_style_request(start: int, end: int, text_style: dict, fields: str) -> dict:
+    """Build an updateTextStyle request applying text_style to [start, end)."""
+    return {
+        'updateTextStyle': {
+            'range': {'startIndex': start, 'endIndex': end},
+            'textStyle': text_style,
+            'fields': fields
+        }
+    }
+
+
 class GoogleDocsConverter:
     """
     Converts markdown files with YAML front matter to Google Docs.
@@ -65,18 +460,45 @@ class GoogleDocsConverter:
         >>> print(result['webViewLink'])
     """
 
-    def __init__(self, docs_service: Resource, drive_service: Resource):
+    def __init__(
+        self,
+        docs_service: Resource,
+        drive_service: Resource,
+        credentials=None
+    ):
         """
         Initialize converter with Google API service clients.
 
         Args:
             docs_service: Google Docs API v1 service
             drive_service: Google Drive API v3 service
+            credentials: OAuth credentials the services were built with
+                (optional; enables concurrent image uploads, each on its own
+                authorized HTTP connection)
         """
         self.docs_service = docs_service
         self.drive_service = drive_service
         self.logger = logger
 
+        # The services' httplib2 connection is not thread-safe, so concurrent
+        # uploads need per-thread connections; without credentials to build
+        # them, uploads are serialized on drive_service's own connection
+        self._credentials = credentials
+        self._upload_http = threading.local()
+        self._upload_slots = threading.BoundedSemaphore(
+            _IMAGE_UPLOAD_WORKERS if credentials is not None else 1
+        )
+
+        # Bind API methods once: each docs_service.documents() etc. call
+        # builds a fresh dynamic Resource from the discovery document
+        documents = docs_service.documents()
+        files = drive_service.files()
+        self._docs_batch_update = documents.batchUpdate
+        self._docs_get = documents.get
+        self._drive_files_create = files.create
+        self._drive_permissions_create = drive_service.permissions().create
+        self._http = _image_http
+
     def convert(
         self,
         markdown_content: str,
@@ -108,30 +530,48 @@ class GoogleDocsConverter:
         start_time = time.time()
 
         try:
-            # Step 1: Parse front matter and content
-            metadata, markdown_body = self._parse_markdown(markdown_content)
+            # Step 1: Parse front matter and content. Re-submissions of the
+            # same markdown reuse the earlier parse and body requests.
+            cache_key = _build_cache_key(markdown_content)
+            cached = _get_cached_build(cache_key) if cache_key is not None else None
+            if cached is not None:
+                metadata, requests = cached
+                self.logger.debug("Reusing parsed markdown from cache")
+            else:
+                metadata, markdown_body = self._parse_markdown(markdown_content)
+                requests = None
 
             # Override title from front matter if present
             if 'title' in metadata:
                 title = metadata['title']
                 self.logger.debug(f"Using title from front matter: {title}")
 
-            # Step 2: Create empty document
-            doc_id = self._create_document(title)
-            self.logger.info(f"Document created: {doc_id}")
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                # Step 2: Create empty document. The create round-trip runs
+                # in the background while the body requests are built.
+                creating = executor.submit(self._create_document, title)
 
-            # Step 3: Apply content to document
-            self._apply_content(doc_id, markdown_body, metadata)
-            self.logger.info(f"Content applied to document: {doc_id}")
+                if requests is None:
+                    self.logger.debug("Building API requests for markdown body")
+                    requests = self._build_requests(markdown_body)
+                    if cache_key is not None:
+                        _store_cached_build(cache_key, metadata, requests)
 
-            # Step 4: Set permissions if requested
-            if make_public:
-                self._make_public(doc_id)
-                self.logger.info(f"Document made publicly viewable: {doc_id}")
+                doc_id, web_link = creating.result()
+                self.logger.info(f"Document created: {doc_id}")
 
-            # Step 5: Get shareable link
-            web_link = self._get_share_link(doc_id)
-            self.logger.info(f"Shareable link generated: {web_link}")
+                # Step 3: Apply content to document while Drive sets
+                # permissions if requested (step 4). Neither depends on the
+                # other, and the Docs and Drive clients each own their HTTP
+                # connection, so the two calls can run concurrently.
+                sharing = executor.submit(self._make_public, doc_id) if make_public else None
+
+                self._apply_content(doc_id, requests, metadata)
+                self.logger.info(f"Content applied to document: {doc_id}")
+
+                if sharing is not None:
+                    sharing.result()
+                    self.logger.info(f"Document made publicly viewable: {doc_id}")
 
             elapsed = time.time() - start_time
             self.logger.info(f"Conversion completed in {elapsed:.2f}s")
@@ -181,73 +621,227 @@ class GoogleDocsConverter:
             'My Document'
         """
         try:
-            post = frontmatter.loads(content)
-            self.logger.debug(f"Parsed front matter: {list(post.metadata.keys())}")
-            return post.metadata, post.content
+            text = content.strip()
+            if not _FRONT_MATTER_BOUNDARY_RE.match(text):
+                return {}, text
+
+            try:
+                _, front_matter, body = _FRONT_MATTER_BOUNDARY_RE.split(text, 2)
+            except ValueError:
+                # Opening delimiter without a closing one
+                return {}, text
+
+            metadata = yaml.load(front_matter, Loader=_YAML_LOADER)
+            if not isinstance(metadata, dict):
+                metadata = {}
+
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"Parsed front matter: {list(metadata.keys())}")
+            return metadata, body.strip()
         except Exception as e:
             self.logger.warning(f"Failed to parse front matter: {e}")
             # If parsing fails, treat entire content as markdown
             return {}, content
 
-    def _create_document(self, title: str) -> str:
+    def _execute_with_retry(
+        self,
+        request,
+        max_attempts: int = 5,
+        http=None,
+        idempotent: bool = False
+    ):
+        """
+        Execute a Google API request, retrying rate limits and server errors.
+
+        Retries 429 and rate-limit 403 responses for every request, and 5xx
+        responses only for idempotent ones (a 5xx may follow a write Google
+        already applied, and repeating e.g. files.create would duplicate it).
+        Waits for the server's Retry-After delay when given, otherwise backs
+        off exponentially, plus up to a second of jitter. Only the failed
+        request is re-issued, so work already done (e.g. the created
+        document) is kept.
+
+        Args:
+            request: googleapiclient HttpRequest to execute
+            max_attempts: Total attempts before giving up (default: 5)
+            http: HTTP connection to send the request on (optional; defaults
+                to the service's own)
+            idempotent: Whether the request is safe to repeat, enabling 5xx
+                retries (default False)
+
+        Returns:
+            The decoded API response
+
+        Raises:
+            HttpError: If the request fails with a non-retryable status or
+                still fails after max_attempts
+        """
+        for attempt in range(max_attempts):
+            try:
+                return request.execute(http=http)
+            except HttpError as e:
+                # 403 is also how Drive reports (user)RateLimitExceeded
+                retryable = (
+                    e.resp.status in _RATE_LIMIT_STATUSES
+                    or (idempotent and e.resp.status in _SERVER_ERROR_STATUSES)
+                    or (e.resp.status == 403
+                        and b'ratelimitexceeded' in (e.content or b'').lower())
+                )
+                if not retryable or attempt == max_attempts - 1:
+                    raise
+
+                retry_after = e.resp.get('retry-after', '')
+                delay = float(retry_after) if retry_after.isdigit() else 0.0
+                delay = min(max(delay, _RETRY_BASE_DELAY * 2 ** attempt), _RETRY_MAX_DELAY)
+                delay += random.uniform(0, 1)
+
+                self.logger.warning(
+                    f"Google API returned {e.resp.status}, retrying in {delay:.1f}s "
+                    f"(attempt {attempt + 1}/{max_attempts})"
+                )
+                time.sleep(delay)
+
+    def _batch_update(
+        self,
+        doc_id: str,
+        requests: List[dict],
+        revision_id: Optional[str] = None
+    ) -> None:
+        """
+        Send requests to the document in batchUpdate calls of bounded size.
+
+        Requests are sent in order, each batch after the previous one has
+        been applied. Content inserts precede the style ranges that use
+        their indices, so any split point is valid.
+
+        Every batch is pinned to the revision the previous one produced
+        (writeControl.requiredRevisionId), so a batch replayed after a 5xx
+        that Google had in fact applied is rejected instead of inserting the
+        content twice; that makes the batches safe to retry.
+
+        Args:
+            doc_id: Document ID
+            requests: Docs API request dicts in application order
+            revision_id: Current revision of the document (optional; fetched
+                if not given)
+
+        Raises:
+            HttpError: If a batchUpdate fails
+        """
+        if revision_id is None:
+            revision_id = self._get_revision_id(doc_id)
+
+        for offset in range(0, len(requests), _MAX_BATCH_REQUESTS):
+            response = self._execute_with_retry(self._docs_batch_update(
+                documentId=doc_id,
+                body={
+                    'requests': requests[offset:offset + _MAX_BATCH_REQUESTS],
+                    'writeControl': {'requiredRevisionId': revision_id}
+                }
+            ), idempotent=True)
+            revision_id = response['writeControl']['requiredRevisionId']
+
+    def _get_revision_id(self, doc_id: str) -> str:
+        """
+        Get the document's current revision ID.
+
+        Args:
+            doc_id: Document ID
+
+        Returns:
+            str: Revision ID
+
+        Raises:
+            HttpError: If the document cannot be read
+        """
+        document = self._execute_with_retry(self._docs_get(
+            documentId=doc_id,
+            fields='revisionId'
+        ), idempotent=True)
+        return document['revisionId']
+
+    def _create_document(self, title: str) -> Tuple[str, str]:
         """
         Create empty Google Docs document.
 
+        The document is created through Drive so the same reply carries its
+        shareable link, saving a files.get round-trip.
+
         Args:
             title: Document title
 
         Returns:
-            str: Document ID
+            Tuple of (document ID, web view link URL)
 
         Raises:
             HttpError: If document creation fails
         """
         self.logger.debug(f"Creating document with title: {title}")
 
-        document = self.docs_service.documents().create(
-            body={'title': title}
-        ).execute()
+        file = self._execute_with_retry(self._drive_files_create(
+            body={'name': title, 'mimeType': _GOOGLE_DOCS_MIME_TYPE},
+            fields='id,webViewLink'
+        ))
 
-        doc_id = document.get('documentId')
+        doc_id = file.get('id')
+        web_link = file.get('webViewLink')
         self.logger.debug(f"Document created with ID: {doc_id}")
+        self.logger.debug(f"Share link: {web_link}")
 
-        return doc_id
+        return doc_id, web_link
 
-    def _create_first_page_header(self, doc_id: str, metadata: Dict) -> None:
+    def _create_header(self, doc_id: str) -> Tuple[str, str]:
         """
-        Create a header on the first page with front matter content.
+        Create an empty default header on the document.
+
+        Only the createHeader call needs its own round-trip (its reply
+        carries the header ID); the header text is sent with the body
+        batch, see _build_header_requests.
 
         Args:
             doc_id: Document ID
-            metadata: Front matter metadata dict
+
+        Returns:
+            Tuple of (header segment ID, document revision ID after the
+            header was created)
 
         Raises:
             HttpError: If header creation fails
         """
-        self.logger.debug("Creating header with front matter")
+        self.logger.debug("Creating header for front matter")
 
         # Create default header (appears on all pages including first)
-        requests = [{
-            'createHeader': {
-                'type': 'DEFAULT'
-            }
-        }]
-
-        # Execute to get header ID
-        response = self.docs_service.documents().batchUpdate(
+        response = self._execute_with_retry(self._docs_batch_update(
             documentId=doc_id,
-            body={'requests': requests}
-        ).execute()
+            body={'requests': [{
+                'createHeader': {
+                    'type': 'DEFAULT'
+                }
+            }]}
+        ))
 
         # Get the header ID from the response
         header_id = response['replies'][0]['createHeader']['headerId']
         self.logger.debug(f"Created header with ID: {header_id}")
 
-        # Step 4: Build front matter content for header
+        return header_id, response['writeControl']['requiredRevisionId']
+
+    def _build_header_requests(self, header_id: str, metadata: Dict) -> List[dict]:
+        """
+        Build requests that fill the header with front matter content.
+
+        Args:
+            header_id: Header segment ID from _create_header
+            metadata: Front matter metadata dict
+
+        Returns:
+            List of Docs API request dicts targeting the header segment
+        """
+        # Build front matter content for header
         header_text = self._format_front_matter_for_header(metadata)
 
-        # Step 5: Insert text into header
-        insert_requests = [{
+        # Insert text into header
+        header_requests = [{
             'insertText': {
                 'location': {
                     'segmentId': header_id,
@@ -259,30 +853,20 @@ class GoogleDocsConverter:
 
         # Apply text formatting to header
         # Apply bold to the entire header text
-        if len(header_text) > 0:
-            insert_requests.append({
+        if header_text:
+            header_requests.append({
                 'updateTextStyle': {
                     'range': {
                         'segmentId': header_id,
                         'startIndex': 0,
-                        'endIndex': len(header_text)
-                    },
-                    'textStyle': {
-                        'fontSize': {
-                            'magnitude': 10,
-                            'unit': 'PT'
-                        }
+                        'endIndex': _u16_len(header_text)
                     },
+                    'textStyle': _HEADER_TEXT_STYLE,
                     'fields': 'fontSize'
                 }
             })
 
-        self.docs_service.documents().batchUpdate(
-            documentId=doc_id,
-            body={'requests': insert_requests}
-        ).execute()
-
-        self.logger.debug("Front matter added to header")
+        return header_requests
 
     def _format_front_matter_for_header(self, metadata: Dict) -> str:
         """
@@ -304,7 +888,7 @@ class GoogleDocsConverter:
         for key, value in metadata.items():
             if key != 'title':
                 # Format key nicely
-                key_display = key.replace('_', ' ').title()
+                key_display = _format_metadata_key(key)
 
                 # Handle different value types
                 if isinstance(value, list):
@@ -321,7 +905,7 @@ class GoogleDocsConverter:
     def _apply_content(
         self,
         doc_id: str,
-        markdown_body: str,
+        requests: List[dict],
         metadata: Dict
     ) -> None:
         """
@@ -329,32 +913,30 @@ class GoogleDocsConverter:
 
         Args:
             doc_id: Document ID
-            markdown_body: Markdown content (without front matter)
+            requests: Body requests from _build_requests
             metadata: Front matter metadata dict
 
         Raises:
             HttpError: If batchUpdate fails
         """
-        self.logger.debug(f"Building API requests for document: {doc_id}")
-
-        # If we have front matter, add it to the first page header
+        # If we have front matter, add it to the first page header. The
+        # header text rides along in the body batch (ops are routed by
+        # segmentId), so only createHeader needs its own round-trip.
+        revision_id = None
         if metadata:
-            self._create_first_page_header(doc_id, metadata)
-
-        # Build list of batchUpdate requests for markdown body
-        requests = self._build_requests(markdown_body, metadata=None)  # No metadata in body anymore
+            header_id, revision_id = self._create_header(doc_id)
+            requests = self._build_header_requests(header_id, metadata) + requests
+            self.logger.debug("Front matter added to header")
 
         if not requests:
             self.logger.warning("No API requests generated - empty document")
             return
 
+        requests = _coalesce_insert_requests(requests)
         self.logger.debug(f"Applying {len(requests)} requests to document")
 
-        # Apply all requests in single batch
-        self.docs_service.documents().batchUpdate(
-            documentId=doc_id,
-            body={'requests': requests}
-        ).execute()
+        # Apply header and body requests together
+        self._batch_update(doc_id, requests, revision_id)
 
         self.logger.debug(f"Successfully applied {len(requests)} requests")
 
@@ -371,18 +953,10 @@ class GoogleDocsConverter:
 
         Note: Front matter is now added to the header, not the body.
         """
-        requests = []
         start_index = 1
 
         # Convert markdown to API requests (starting from index 1)
-        self.logger.debug("Using custom markdown parser")
-        md_requests = self._parse_markdown_to_requests(markdown_body, start_index)
-        if isinstance(md_requests, list):
-            requests.extend(md_requests)
-        elif md_requests:
-            requests.append(md_requests)
-
-        return requests
+        return self._parse_markdown_to_requests(markdown_body, start_index)
 
     def _format_front_matter(self, metadata: Dict) -> tuple:
         """
@@ -408,26 +982,19 @@ class GoogleDocsConverter:
                     'text': title_text
                 }
             })
-            requests.append({
-                'updateParagraphStyle': {
-                    'range': {
-                        'startIndex': current_index,
-                        'endIndex': current_index + len(title_text) - 1
-                    },
-                    'paragraphStyle': {
-                        'namedStyleType': 'TITLE'
-                    },
-                    'fields': 'namedStyleType'
-                }
-            })
-            current_index += len(title_text)
+            requests.append(_paragraph_style_request(
+                current_index,
+                current_index + _u16_len(title_text) - 1,
+                _TITLE_STYLE
+            ))
+            current_index += _u16_len(title_text)
 
         # Other metadata as subtitle
         metadata_lines = []
         for key, value in metadata.items():
             if key != 'title':
                 # Format key nicely
-                key_display = key.replace('_', ' ').title()
+                key_display = _format_metadata_key(key)
 
                 # Handle different value types
                 if isinstance(value, list):
@@ -447,19 +1014,12 @@ class GoogleDocsConverter:
                     'text': subtitle_text
                 }
             })
-            requests.append({
-                'updateParagraphStyle': {
-                    'range': {
-                        'startIndex': current_index,
-                        'endIndex': current_index + len(subtitle_text) - 1
-                    },
-                    'paragraphStyle': {
-                        'namedStyleType': 'SUBTITLE'
-                    },
-                    'fields': 'namedStyleType'
-                }
-            })
-            current_index += len(subtitle_text)
+            requests.append(_paragraph_style_request(
+                current_index,
+                current_index + _u16_len(subtitle_text) - 1,
+                _SUBTITLE_STYLE
+            ))
+            current_index += _u16_len(subtitle_text)
 
         # Add spacing after front matter
         requests.append({
@@ -472,13 +1032,17 @@ class GoogleDocsConverter:
 
         return requests, current_index
 
-    def _parse_markdown_to_requests(self, text: str, start_index: int = 1):
+    def _parse_markdown_to_requests(self, text: str, start_index: int = 1) -> List[dict]:
         """
         Parse markdown and convert to Google Docs API requests.
 
         Converts markdown syntax to properly formatted Google Docs API requests.
         Supports: headings (H1-H6), bold, italic, paragraphs, and line breaks.
 
+        The whole body is inserted with a single insertText request; heading
+        and emphasis styles follow as range updates computed from offsets
+        into that text, so no request shifts the indices of another.
+
         Args:
             text: Markdown text content to parse
             start_index: Starting index position in document (default: 1)
@@ -486,120 +1050,88 @@ class GoogleDocsConverter:
         Returns:
             list: List of Google Docs API request dicts
         """
-        import re
+        # No heading or emphasis markers: the whole body is one plain insert
+        if '#' not in text and '*' not in text and '_' not in text:
+            return [{
+                'insertText': {
+                    'location': {'index': start_index},
+                    'text': _BLANK_LINE_RE.sub('', text) + '\n'
+                }
+            }]
 
-        requests = []
+        parts = []
+        style_requests = []
+        # Bound once; called for every line and span
+        add_part = parts.append
+        add_style = style_requests.append
         current_index = start_index
 
-        # Split into lines and process
-        lines = text.split('\n')
-
-        for line in lines:
+        # Process line by line without materializing a list of lines
+        for line in _iter_lines(text):
             if not line.strip():
                 # Empty line - add paragraph break
-                requests.append({
-                    'insertText': {
-                        'location': {'index': current_index},
-                        'text': '\n'
-                    }
-                })
+                add_part('\n')
                 current_index += 1
                 continue
 
-            # Check for headings (# heading)
-            heading_match = re.match(r'^(#{1,6})\s+(.+)$', line)
+            # Check for headings (# heading); most lines are prose, so skip
+            # the regex unless the line can start one
+            heading_match = _HEADING_RE.match(line) if line[0] == '#' else None
             if heading_match:
                 level = len(heading_match.group(1))
                 text_content = heading_match.group(2) + '\n'
-
-                # Insert text
-                requests.append({
-                    'insertText': {
-                        'location': {'index': current_index},
-                        'text': text_content
-                    }
-                })
+                add_part(text_content)
+                length = _u16_len(text_content)
 
                 # Style as heading
-                heading_type = f'HEADING_{level}' if level <= 6 else 'HEADING_6'
-                requests.append({
-                    'updateParagraphStyle': {
-                        'range': {
-                            'startIndex': current_index,
-                            'endIndex': current_index + len(text_content) - 1
-                        },
-                        'paragraphStyle': {
-                            'namedStyleType': heading_type
-                        },
-                        'fields': 'namedStyleType'
-                    }
-                })
+                add_style(_paragraph_style_request(
+                    current_index,
+                    current_index + length - 1,
+                    _HEADING_STYLES[level]
+                ))
 
-                current_index += len(text_content)
+                current_index += length
                 continue
 
             # Regular paragraph with inline formatting
             line_text = line + '\n'
-
-            # Insert the line
-            requests.append({
-                'insertText': {
-                    'location': {'index': current_index},
-                    'text': line_text
-                }
-            })
-
-            # Apply bold formatting (**text** or __text__)
-            for match in re.finditer(r'\*\*(.+?)\*\*|__(.+?)__', line):
-                start = current_index + match.start()
-                end = current_index + match.end()
-                requests.append({
-                    'updateTextStyle': {
-                        'range': {
-                            'startIndex': start,
-                            'endIndex': end
-                        },
-                        'textStyle': {
-                            'bold': True
-                        },
-                        'fields': 'bold'
-                    }
-                })
-
-            # Apply italic formatting (*text* or _text_)
-            for match in re.finditer(r'(?<!\*)\*([^*]+?)\*(?!\*)|(?<!_)_([^_]+?)_(?!_)', line):
-                start = current_index + match.start()
-                end = current_index + match.end()
-                requests.append({
-                    'updateTextStyle': {
-                        'range': {
-                            'startIndex': start,
-                            'endIndex': end
-                        },
-                        'textStyle': {
-                            'italic': True
-                        },
-                        'fields': 'italic'
-                    }
-                })
-
-            current_index += len(line_text)
-
-        # If no requests were created, just insert the raw text
-        if not requests:
-            return {
-                'insertText': {
-                    'location': {'index': 1},
-                    'text': text
-                }
-            }
-
-        return requests if isinstance(requests, list) and len(requests) > 1 else requests[0] if requests else {
+            add_part(line_text)
+
+            # Emphasis needs a marker character; most prose lines have none,
+            # so check once before scanning the line for spans
+            if '*' in line or '_' in line:
+                # Apply bold formatting (**text** or __text__)
+                for start, end in _merge_adjacent_spans(_bold_spans(line)):
+                    start, end = _u16_span(line, start, end)
+                    add_style(_text_style_request(
+                        current_index + start,
+                        current_index + end,
+                        _BOLD_STYLE,
+                        'bold'
+                    ))
+
+                # Apply italic formatting (*text* or _text_)
+                for start, end in _merge_adjacent_spans(_italic_spans(line)):
+                    start, end = _u16_span(line, start, end)
+                    add_style(_text_style_request(
+                        current_index + start,
+                        current_index + end,
+                        _ITALIC_STYLE,
+                        'italic'
+                    ))
+
+            current_index += _u16_len(line_text)
+
+        # One insert for the full body, then the style ranges over it
+        requests = [{
             'insertText': {
-                'location': {'index': 1},
-                'text': text
+                'location': {'index': start_index},
+                'text': ''.join(parts)
             }
-        }
+        }]
+        requests.extend(style_requests)
+
+        return requests
 
     def convert_html(
         self,
@@ -633,7 +1165,7 @@ class GoogleDocsConverter:
 
         try:
             # Step 1: Create empty document
-            doc_id = self._create_document(title)
+            doc_id, web_link = self._create_document(title)
             self.logger.info(f"Document created: {doc_id}")
 
             # Step 2: Parse HTML and apply content
@@ -645,10 +1177,6 @@ class GoogleDocsConverter:
                 self._make_public(doc_id)
                 self.logger.info(f"Document made publicly viewable: {doc_id}")
 
-            # Step 4: Get shareable link
-            web_link = self._get_share_link(doc_id)
-            self.logger.info(f"Shareable link generated: {web_link}")
-
             elapsed = time.time() - start_time
             self.logger.info(f"HTML conversion completed in {elapsed:.2f}s")
 
@@ -701,13 +1229,11 @@ class GoogleDocsConverter:
             self.logger.warning("No API requests generated - empty document")
             return
 
+        requests = _coalesce_insert_requests(requests)
         self.logger.debug(f"Applying {len(requests)} requests to document")
 
-        # Apply all requests in single batch
-        self.docs_service.documents().batchUpdate(
-            documentId=doc_id,
-            body={'requests': requests}
-        ).execute()
+        # Apply all requests
+        self._batch_update(doc_id, requests)
 
         self.logger.debug(f"Successfully applied {len(requests)} requests")
 
@@ -727,29 +1253,42 @@ class GoogleDocsConverter:
         Example:
             >>> requests = converter._parse_html_to_requests('<h1>Title</h1><p>Text</p>')
         """
-        self.logger.debug("Parsing HTML with BeautifulSoup")
+        self.logger.debug(f"Parsing HTML with BeautifulSoup ({HTML_PARSER})")
 
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = BeautifulSoup(html_content, HTML_PARSER)
         except Exception as e:
             self.logger.error(f"Failed to parse HTML: {e}")
             raise GoogleDocsConversionError(f"Invalid HTML content: {e}")
 
+        # Content (text/image inserts) in document order; styles are
+        # appended after it so adjacent text inserts can be coalesced
         requests = []
-        current_index = start_index
+        style_requests = []
 
         # Process body content (or entire soup if no body tag)
         body = soup.find('body') or soup
 
-        for element in body.descendants:
-            # Skip text nodes that are just whitespace
-            if element.name is None and not str(element).strip():
-                continue
+        # Start all image downloads and Drive uploads up front so their
+        # round-trips overlap
+        image_uploads, executor = self._prefetch_images(body)
 
-            # Process elements
-            if element.name in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
+        def emit(element, current_index: int) -> Tuple[int, bool]:
+            """
+            Emit requests for element itself.
+
+            Returns the next index and whether the walk should descend into
+            the element's children.
+            """
+            name = element.name
+
+            # Text nodes outside headings/paragraphs are not emitted
+            if name is None:
+                return current_index, False
+
+            if name in _HEADING_TAGS:
                 # Heading
-                level = int(element.name[1])
+                level = int(name[1])
                 text = element.get_text() + '\n'
 
                 requests.append({
@@ -759,27 +1298,16 @@ class GoogleDocsConverter:
                     }
                 })
 
-                heading_type = f'HEADING_{level}' if level <= 6 else 'HEADING_6'
-                requests.append({
-                    'updateParagraphStyle': {
-                        'range': {
-                            'startIndex': current_index,
-                            'endIndex': current_index + len(text) - 1
-                        },
-                        'paragraphStyle': {
-                            'namedStyleType': heading_type
-                        },
-                        'fields': 'namedStyleType'
-                    }
-                })
+                style_requests.append(_paragraph_style_request(
+                    current_index,
+                    current_index + _u16_len(text) - 1,
+                    _HEADING_STYLES[level]
+                ))
 
-                current_index += len(text)
-                # Consume children
-                for child in element.descendants:
-                    if child != element:
-                        child.extract()
+                # Children are consumed by get_text(); don't descend
+                return current_index + _u16_len(text), False
 
-            elif element.name == 'p':
+            if name == 'p':
                 # Paragraph
                 text = element.get_text() + '\n'
 
@@ -790,18 +1318,16 @@ class GoogleDocsConverter:
                     }
                 })
 
-                current_index += len(text)
-                # Consume children
-                for child in element.descendants:
-                    if child != element:
-                        child.extract()
+                return current_index + _u16_len(text), False
 
-            elif element.name == 'img':
+            if name == 'img':
                 # Image - fetch and upload to Drive
                 img_url = element.get('src')
                 if img_url:
                     try:
-                        image_request = self._create_image_request(img_url, current_index)
+                        image_request = self._create_image_request(
+                            img_url, current_index, image_uploads.get(img_url)
+                        )
                         if image_request:
                             requests.append(image_request)
                             current_index += 1  # Images take 1 index position
@@ -815,9 +1341,10 @@ class GoogleDocsConverter:
                                 'text': placeholder
                             }
                         })
-                        current_index += len(placeholder)
+                        current_index += _u16_len(placeholder)
+                return current_index, False
 
-            elif element.name == 'br':
+            if name == 'br':
                 # Line break
                 requests.append({
                     'insertText': {
@@ -825,7 +1352,31 @@ class GoogleDocsConverter:
                         'text': '\n'
                     }
                 })
-                current_index += 1
+                return current_index + 1, False
+
+            # Container element - descend in document order
+            return current_index, True
+
+        try:
+            # Depth-first walk in document order with an explicit stack of
+            # child iterators, so arbitrarily deep nesting cannot exhaust
+            # the interpreter's recursion limit
+            current_index = start_index
+            stack = [iter(body.children)]
+            while stack:
+                child = next(stack[-1], None)
+                if child is None:
+                    stack.pop()
+                    continue
+                current_index, descend = emit(child, current_index)
+                if descend:
+                    stack.append(iter(child.children))
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+        # Style ranges use final indices, so they apply after all content
+        requests.extend(style_requests)
 
         # If no requests were created, insert the plain text
         if not requests:
@@ -840,19 +1391,79 @@ class GoogleDocsConverter:
 
         return requests
 
-    def _create_image_request(self, image_url: str, index: int) -> Optional[dict]:
+    def _prefetch_images(self, body) -> Tuple[Dict[str, Future], Optional[ThreadPoolExecutor]]:
         """
-        Fetch image from URL, upload to Drive, and create insert request.
+        Start downloading and uploading every image the HTML walk will insert.
+
+        Only images outside headings/paragraphs are inserted (those blocks
+        are flattened to text), so only those are fetched.
+
+        Args:
+            body: Parsed body element
+
+        Returns:
+            Tuple of (image URL -> Drive file ID future, executor or None if
+            no images)
+        """
+        image_urls = []
+        for img in body.find_all('img'):
+            src = img.get('src')
+            if src and src not in image_urls and not img.find_parent(_TEXT_BLOCK_TAGS):
+                image_urls.append(src)
+
+        if not image_urls:
+            return {}, None
+
+        self.logger.debug(f"Prefetching {len(image_urls)} images")
+        executor = ThreadPoolExecutor(max_workers=min(_IMAGE_FETCH_WORKERS, len(image_urls)))
+        return {url: executor.submit(self._fetch_and_upload_image, url) for url in image_urls}, executor
+
+    def _fetch_and_upload_image(self, image_url: str) -> Optional[str]:
+        """
+        Download an image and upload it to Drive.
 
         Args:
             image_url: URL of image to fetch
-            index: Index position to insert image
 
         Returns:
-            Google Docs API request dict for inserting image, or None if failed
+            Drive file ID, or None if the image was skipped
+        """
+        image = self._fetch_image(image_url)
+        if image is None:
+            return None
+        content, content_type = image
+
+        with self._upload_slots:
+            return self._upload_image(content, content_type)
+
+    def _thread_http(self):
+        """
+        Get this thread's authorized HTTP connection for Drive uploads.
+
+        Returns:
+            AuthorizedHttp, or None to use drive_service's own connection
+        """
+        if self._credentials is None:
+            return None
+        http = getattr(self._upload_http, 'http', None)
+        if http is None:
+            http = google_auth_httplib2.AuthorizedHttp(self._credentials, http=build_http())
+            self._upload_http.http = http
+        return http
+
+    def _fetch_image(self, image_url: str) -> Optional[Tuple[bytes, str]]:
+        """
+        Download an image for embedding.
+
+        Args:
+            image_url: URL of image to fetch
+
+        Returns:
+            Tuple of (image bytes, content type), or None if the URL is unsafe,
+            not an image, or too large
 
         Raises:
-            Exception: If image fetch or upload fails
+            requests.RequestException: If the download fails
         """
         # Validate URL (SSRF prevention)
         if not validate_image_url(image_url):
@@ -863,29 +1474,60 @@ class GoogleDocsConverter:
 
         try:
             # Fetch image
-            response = requests.get(
+            # Stream the body so oversized images are rejected without
+            # downloading them in full
+            with self._http.get(
                 image_url,
                 timeout=10,
+                stream=True,
                 headers={'User-Agent': 'MD-Converter/1.0'}
-            )
-            response.raise_for_status()
+            ) as response:
+                response.raise_for_status()
+
+                # Get content type
+                content_type = response.headers.get('content-type', 'image/png')
+                if not content_type.startswith('image/'):
+                    self.logger.warning(f"URL is not an image: {content_type}")
+                    return None
+
+                # Check size (max 10MB) - declared length first, then as it arrives
+                declared_size = response.headers.get('Content-Length')
+                if declared_size and declared_size.isdigit() and int(declared_size) > _MAX_IMAGE_SIZE:
+                    self.logger.warning(f"Image too large: {declared_size} bytes")
+                    return None
+
+                buffer = io.BytesIO()
+                for chunk in response.iter_content(_IMAGE_CHUNK_SIZE):
+                    if buffer.tell() + len(chunk) > _MAX_IMAGE_SIZE:
+                        self.logger.warning(f"Image too large: over {_MAX_IMAGE_SIZE} bytes")
+                        return None
+                    buffer.write(chunk)
+
+                return buffer.getvalue(), content_type
 
-            # Get content type
-            content_type = response.headers.get('content-type', 'image/png')
-            if not content_type.startswith('image/'):
-                self.logger.warning(f"URL is not an image: {content_type}")
-                return None
+        except requests.RequestException as e:
+            self.logger.error(f"Failed to fetch image {image_url}: {e}")
+            raise
 
-            # Check size (max 10MB)
-            if len(response.content) > 10 * 1024 * 1024:
-                self.logger.warning(f"Image too large: {len(response.content)} bytes")
-                return None
+    def _upload_image(self, content: bytes, content_type: str) -> str:
+        """
+        Upload image bytes to Drive.
 
-            # Upload to Drive
+        Args:
+            content: Image bytes
+            content_type: Image MIME type
+
+        Returns:
+            Drive file ID
+
+        Raises:
+            HttpError: If the upload fails
+        """
+        try:
             media = MediaIoBaseUpload(
-                io.BytesIO(response.content),
+                io.BytesIO(content),
                 mimetype=content_type,
-                resumable=True
+                resumable=len(content) > _RESUMABLE_UPLOAD_THRESHOLD
             )
 
             file_metadata = {
@@ -893,54 +1535,55 @@ class GoogleDocsConverter:
                 'mimeType': content_type
             }
 
-            file = self.drive_service.files().create(
+            file = self._execute_with_retry(self._drive_files_create(
                 body=file_metadata,
                 media_body=media,
                 fields='id,webContentLink'
-            ).execute()
+            ), http=self._thread_http())
 
             file_id = file.get('id')
             self.logger.debug(f"Image uploaded to Drive: {file_id}")
+            return file_id
 
-            # Create insertInlineImage request
-            return {
-                'insertInlineImage': {
-                    'uri': f"https://drive.google.com/uc?id={file_id}",
-                    'location': {'index': index}
-                }
-            }
-
-        except requests.RequestException as e:
-            self.logger.error(f"Failed to fetch image {image_url}: {e}")
-            raise
         except HttpError as e:
             self.logger.error(f"Failed to upload image to Drive: {e}")
             raise
 
-    def _get_share_link(self, doc_id: str) -> str:
+    def _create_image_request(
+        self,
+        image_url: str,
+        index: int,
+        upload: Optional[Future] = None
+    ) -> Optional[dict]:
         """
-        Get shareable link for document.
+        Fetch image from URL, upload to Drive, and create insert request.
 
         Args:
-            doc_id: Document ID
+            image_url: URL of image to fetch
+            index: Index position to insert image
+            upload: Pending _fetch_and_upload_image result from
+                _prefetch_images (optional; the image is fetched and uploaded
+                here if not given)
 
         Returns:
-            str: Web view link URL
+            Google Docs API request dict for inserting image, or None if failed
 
         Raises:
-            HttpError: If Drive API request fails
+            Exception: If image fetch or upload fails
         """
-        self.logger.debug(f"Fetching share link for document: {doc_id}")
-
-        file = self.drive_service.files().get(
-            fileId=doc_id,
-            fields='webViewLink'
-        ).execute()
-
-        web_link = file.get('webViewLink')
-        self.logger.debug(f"Share link: {web_link}")
+        if upload is not None:
+            file_id = upload.result()
+        else:
+            file_id = self._fetch_and_upload_image(image_url)
+        if file_id is None:
+            return None
 
-        return web_link
+        return {
+            'insertInlineImage': {
+                'uri': f"https://drive.google.com/uc?id={file_id}",
+                'location': {'index': index}
+            }
+        }
 
     def _make_public(self, doc_id: str) -> None:
         """
@@ -957,12 +1600,13 @@ class GoogleDocsConverter:
         """
         self.logger.debug(f"Making document public: {doc_id}")
 
-        self.drive_service.permissions().create(
+        # Re-granting the same permission is a no-op, so 5xx can be retried
+        self._execute_with_retry(self._drive_permissions_create(
             fileId=doc_id,
             body={
                 'type': 'anyone',
                 'role': 'reader'
             }
-        ).execute()
+        ), idempotent=True)
 
         self.logger.debug(f"Document {doc_id} is now publicly viewable")
@@ -13,15 +13,50 @@ Dependencies:
 Used by: app/api/routes.py for handling HTML conversion requests
 """
 import pypandoc
+import hashlib
 import logging
+import re
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 from playwright.sync_api import sync_playwright
-from app.utils.security import validate_html_content, count_html_images
+from app.utils.security import validate_html_document
 
 
 logger = logging.getLogger(__name__)
 
+# Recent validation verdicts, keyed by (content digest, max_size, max_images)
+# and holding the error message or None, so re-submitted HTML (retries,
+# previews) skips the size and image-count scans
+_VALIDATION_CACHE_SIZE = 256
+_validation_cache: 'OrderedDict[Tuple[bytes, int, int], Optional[str]]' = OrderedDict()
+_validation_cache_lock = threading.Lock()
+_NOT_CACHED = object()
+
+# Complete HTML document opening (after any leading whitespace)
+_FULL_DOCUMENT_RE = re.compile(r'\s*(?:<!DOCTYPE|<html)')
+
+# Document wrapper for HTML fragments: head + CSS + mid + fragment + tail
+_HTML_HEAD = '<!DOCTYPE html><html><head><meta charset="utf-8"><title>Document</title><style>'
+_HTML_MID = '</style></head><body>'
+_HTML_TAIL = '</body></html>'
+
+
+def _looks_like_full_doc(html_content: str) -> bool:
+    """
+    Check whether HTML is a complete document rather than a fragment.
+
+    Matches in place instead of strip()-ing a copy of the whole input.
+
+    Args:
+        html_content: HTML content string
+
+    Returns:
+        True if the content starts with <!DOCTYPE or <html
+    """
+    return _FULL_DOCUMENT_RE.match(html_content) is not None
+
 
 class ConversionError(Exception):
     """Raised when document conversion fails"""
@@ -44,6 +79,10 @@ class HtmlConverter:
         'output.docx'
     """
 
+    # Fragment wrapper head with the default CSS, shared by all instances
+    # (see _get_default_head)
+    _default_head = None
+
     def __init__(self):
         """
         Initialize converter.
@@ -63,7 +102,7 @@ class HtmlConverter:
         """
         try:
             version = pypandoc.get_pandoc_version()
-            logger.debug(f'Pandoc version {version} detected')
+            logger.debug('Pandoc version %s detected', version)
         except OSError as e:
             error_msg = (
                 'Pandoc not found. '
@@ -92,19 +131,27 @@ class HtmlConverter:
         Raises:
             ConversionError: If validation fails
         """
-        # Validate content
-        validation_error = validate_html_content(html_content, max_size)
-        if validation_error:
-            raise ConversionError(
-                f"{validation_error['error']} (code: {validation_error['code']})"
-            )
-
-        # Count images (DOS prevention)
-        image_error = count_html_images(html_content, max_images)
-        if image_error:
-            raise ConversionError(
-                f"{image_error['error']} (code: {image_error['code']})"
-            )
+        # Encoded once; the same bytes key the cache and feed validation
+        encoded = html_content.encode('utf-8')
+        key = (
+            hashlib.blake2b(encoded, digest_size=16).digest(),
+            max_size,
+            max_images
+        )
+        with _validation_cache_lock:
+            error = _validation_cache.get(key, _NOT_CACHED)
+            if error is not _NOT_CACHED:
+                _validation_cache.move_to_end(key)
+
+        if error is _NOT_CACHED:
+            error = self._validation_error(html_content, encoded, max_size, max_images)
+            with _validation_cache_lock:
+                _validation_cache[key] = error
+                while len(_validation_cache) > _VALIDATION_CACHE_SIZE:
+                    _validation_cache.popitem(last=False)
+
+        if error:
+            raise ConversionError(error)
 
         # Skip HTML sanitization - not needed since:
         # 1. Output is DOCX/PDF files, not web pages (no XSS risk)
@@ -112,9 +159,35 @@ class HtmlConverter:
         # 3. Pandoc and WeasyPrint have their own input validation
         # 4. Sanitization breaks CSS formatting and styling
 
-        logger.debug(f'HTML validated: {len(html_content)} bytes')
+        logger.debug('HTML validated: %d bytes', len(html_content))
         return html_content
 
+    def _validation_error(
+        self,
+        html_content: str,
+        encoded: bytes,
+        max_size: int,
+        max_images: int
+    ) -> Optional[str]:
+        """
+        Run the HTML content checks.
+
+        Args:
+            html_content: Raw HTML string
+            encoded: html_content encoded as UTF-8
+            max_size: Maximum allowed size in bytes
+            max_images: Maximum allowed images per document
+
+        Returns:
+            Error message if validation fails, None if valid
+        """
+        # Size/content checks and image count (DOS prevention), one pass
+        validation_error = validate_html_document(html_content, max_size, max_images, encoded)
+        if validation_error:
+            return f"{validation_error['error']} (code: {validation_error['code']})"
+
+        return None
+
     def convert_to_docx(
         self,
         html_content: str,
@@ -145,7 +218,7 @@ class HtmlConverter:
             ...     '/tmp/output.docx'
             ... )
         """
-        logger.info(f'Converting HTML to DOCX: {output_path}')
+        logger.info('Converting HTML to DOCX: %s', output_path)
 
         try:
             # Sanitize if requested
@@ -173,7 +246,7 @@ class HtmlConverter:
             )
 
             file_size = Path(output_path).stat().st_size
-            logger.info(f'Successfully created DOCX: {output_path} ({file_size} bytes)')
+            logger.info('Successfully created DOCX: %s (%d bytes)', output_path, file_size)
             return output_path
 
         except Exception as e:
@@ -213,32 +286,56 @@ class HtmlConverter:
             ...     '/tmp/output.pdf'
             ... )
         """
-        logger.info(f'Converting HTML to PDF: {output_path}')
+        logger.info('Converting HTML to PDF: %s', output_path)
+
+        pdf = self.convert_to_pdf_bytes(html_content, sanitize, base_url, css_style)
 
+        try:
+            Path(output_path).write_bytes(pdf)
+        except OSError as e:
+            error_msg = f'PDF conversion failed: {str(e)}'
+            logger.error(error_msg, exc_info=True)
+            raise ConversionError(error_msg) from e
+
+        logger.info('Successfully created PDF: %s (%d bytes)', output_path, len(pdf))
+        return output_path
+
+    def convert_to_pdf_bytes(
+        self,
+        html_content: str,
+        sanitize: bool = True,
+        base_url: Optional[str] = None,
+        css_style: Optional[str] = None
+    ) -> bytes:
+        """
+        Convert HTML to PDF in memory.
+
+        Args:
+            html_content: HTML content string
+            sanitize: Whether to sanitize HTML (default: True)
+            base_url: Base URL for resolving relative image paths (optional)
+            css_style: Custom CSS for styling (uses default if None)
+
+        Returns:
+            PDF document bytes
+
+        Raises:
+            ConversionError: If conversion fails
+        """
         try:
             # Sanitize if requested
             if sanitize:
                 html_content = self.validate_and_sanitize(html_content)
 
             # Wrap content if it's a fragment (not a complete HTML document)
-            if not html_content.strip().startswith('<!DOCTYPE') and not html_content.strip().startswith('<html'):
+            if not _looks_like_full_doc(html_content):
                 # Default CSS if none provided
                 if css_style is None:
-                    css_style = self._get_default_css()
-
-                html_content = f"""
-                <!DOCTYPE html>
-                <html>
-                <head>
-                    <meta charset="utf-8">
-                    <title>Document</title>
-                    <style>{css_style}</style>
-                </head>
-                <body>
-                    {html_content}
-                </body>
-                </html>
-                """
+                    head = self._get_default_head()
+                else:
+                    head = ''.join((_HTML_HEAD, css_style, _HTML_MID))
+
+                html_content = ''.join((head, html_content, _HTML_TAIL))
 
             # Generate PDF with Playwright (Chromium)
             # Playwright uses real Chrome rendering engine for perfect CSS support
@@ -248,8 +345,7 @@ class HtmlConverter:
                 page.set_content(html_content, wait_until='networkidle')
 
                 # Generate PDF with professional settings
-                page.pdf(
-                    path=output_path,
+                pdf = page.pdf(
                     format='A4',
                     print_background=True,  # Essential for gradients and background colors
                     margin={
@@ -261,15 +357,24 @@ class HtmlConverter:
                 )
                 browser.close()
 
-            file_size = Path(output_path).stat().st_size
-            logger.info(f'Successfully created PDF: {output_path} ({file_size} bytes)')
-            return output_path
+            return pdf
 
         except Exception as e:
             error_msg = f'PDF conversion failed: {str(e)}'
             logger.error(error_msg, exc_info=True)
             raise ConversionError(error_msg) from e
 
+    def _get_default_head(self) -> str:
+        """
+        Get the fragment wrapper up to <body> with the default CSS, built once.
+
+        Returns:
+            HTML string ending in the opening body tag
+        """
+        if HtmlConverter._default_head is None:
+            HtmlConverter._default_head = ''.join((_HTML_HEAD, self._get_default_css(), _HTML_MID))
+        return HtmlConverter._default_head
+
     def _get_default_css(self) -> str:
         """
         Get default CSS styling for PDF generation.
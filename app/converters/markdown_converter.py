@@ -17,16 +17,20 @@ import frontmatter
 import pypandoc
 import markdown
 import logging
+import queue
 from pathlib import Path
 from typing import Dict, Tuple, Optional
 
 # WeasyPrint import with availability check
 try:
-    from weasyprint import HTML
+    from weasyprint import CSS, HTML
+    from weasyprint.text.fonts import FontConfiguration
     WEASYPRINT_AVAILABLE = True
 except ImportError:
     WEASYPRINT_AVAILABLE = False
+    CSS = None
     HTML = None
+    FontConfiguration = None
 
 # python-docx imports for DOCX manipulation
 try:
@@ -46,6 +50,15 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Idle WeasyPrint font configurations. Building one loads the system fonts
+# through fontconfig, so they are reused across conversions; each render
+# checks one out, as the Pango font map inside is not safe to share between
+# concurrent renders.
+_idle_font_configs = queue.SimpleQueue()
+
+# Opening delimiters of the front matter formats python-frontmatter handles
+_FRONT_MATTER_OPENERS = ('---', '+++', '{')
+
 
 class ConversionError(Exception):
     """Raised when document conversion fails"""
@@ -68,6 +81,10 @@ class MarkdownConverter:
     - Applying proper styling and page numbers
     """
 
+    # Parsed default PDF stylesheet, shared by all instances (see
+    # _get_default_stylesheet)
+    _default_stylesheet = None
+
     def __init__(self, template_path: Optional[str] = None):
         """
         Initialize converter with optional Word template.
@@ -201,8 +218,15 @@ class MarkdownConverter:
             >>> print(metadata['title'])
             'My Document'
         """
+        # Nothing any python-frontmatter handler (YAML ---, TOML +++,
+        # JSON {) could detect: skip it. Stripped to match what
+        # frontmatter.loads returns in this case.
+        text = content.strip()
+        if not text.startswith(_FRONT_MATTER_OPENERS):
+            return {}, text
+
         try:
-            post = frontmatter.loads(content)
+            post = frontmatter.loads(text)
             logger.debug(f'Parsed front matter: {post.metadata.keys()}')
             return post.metadata, post.content
         except Exception as e:
@@ -419,7 +443,40 @@ class MarkdownConverter:
 
         Raises:
             ConversionError: If conversion fails
-            IOError: If file cannot be written
+        """
+        logger.info(f'Converting to PDF: {output_path}')
+
+        pdf = self.convert_to_pdf_bytes(content, include_front_matter, css_style)
+
+        try:
+            Path(output_path).write_bytes(pdf)
+        except OSError as e:
+            error_msg = f'PDF conversion failed: {str(e)}'
+            logger.error(error_msg, exc_info=True)
+            raise ConversionError(error_msg) from e
+
+        logger.info(f'Successfully created PDF: {output_path} ({len(pdf)} bytes)')
+        return output_path
+
+    def convert_to_pdf_bytes(
+        self,
+        content: str,
+        include_front_matter: bool = True,
+        css_style: Optional[str] = None
+    ) -> bytes:
+        """
+        Convert markdown to PDF with page numbers, in memory.
+
+        Args:
+            content: Markdown content with YAML front matter
+            include_front_matter: Include front matter in document
+            css_style: Custom CSS for styling (uses default if None)
+
+        Returns:
+            PDF document bytes
+
+        Raises:
+            ConversionError: If conversion fails
         """
         if not WEASYPRINT_AVAILABLE:
             raise ConversionError(
@@ -427,8 +484,6 @@ class MarkdownConverter:
                 "with system dependencies installed."
             )
 
-        logger.info(f'Converting to PDF: {output_path}')
-
         try:
             # Parse content (python-frontmatter handles YAML parsing)
             metadata, md_content = self.parse_markdown(content)
@@ -449,9 +504,12 @@ class MarkdownConverter:
             if include_front_matter and metadata:
                 front_matter_html = self._format_front_matter_html(metadata)
 
-            # Default CSS if none provided
+            # Default CSS if none provided: the shared stylesheet is parsed
+            # once per process, only the title header is inlined per document
+            stylesheets = None
             if css_style is None:
-                css_style = self._get_default_css(metadata.get('title', ''))
+                css_style = self._get_title_css(metadata.get('title', ''))
+                stylesheets = [self._get_default_stylesheet()]
 
             # Build complete HTML document
             html_document = f"""
@@ -470,11 +528,14 @@ class MarkdownConverter:
             """
 
             # Generate PDF with WeasyPrint
-            HTML(string=html_document).write_pdf(output_path)
-
-            file_size = Path(output_path).stat().st_size
-            logger.info(f'Successfully created PDF: {output_path} ({file_size} bytes)')
-            return output_path
+            font_config = self._acquire_font_config()
+            try:
+                return HTML(string=html_document).write_pdf(
+                    stylesheets=stylesheets,
+                    font_config=font_config
+                )
+            finally:
+                _idle_font_configs.put(font_config)
 
         except Exception as e:
             error_msg = f'PDF conversion failed: {str(e)}'
@@ -721,28 +782,23 @@ class MarkdownConverter:
         html += '</div>\n'
         return html
 
-    def _get_default_css(self, title: str = '') -> str:
+    def _get_title_css(self, title: str) -> str:
         """
-        Get default CSS styling for PDF generation.
+        Get the per-document CSS for the title page header.
+
+        Inlined in the document (author origin), so it is kept together with
+        the rule hiding the header on the first page: the shared default
+        stylesheet is applied as a user stylesheet, which author rules
+        override regardless of selector specificity.
 
         Args:
             title: Document title for header
 
         Returns:
-            CSS string with page layout and styling
+            CSS string placing the title in the top-right page margin
         """
         return f"""
         @page {{
-            size: A4;
-            margin: 1in 0.75in;
-
-            @bottom-center {{
-                content: "Page " counter(page) " of " counter(pages);
-                font-size: 10pt;
-                color: #666;
-                font-family: 'Helvetica', sans-serif;
-            }}
-
             @top-right {{
                 content: "{title}";
                 font-size: 9pt;
@@ -752,154 +808,205 @@ class MarkdownConverter:
         }}
 
         @page :first {{
-            @bottom-center {{
-                content: "";
-            }}
             @top-right {{
                 content: "";
             }}
         }}
+        """
 
-        body {{
+    def _get_default_stylesheet(self):
+        """
+        Get the default PDF stylesheet, parsed once per process.
+
+        Returns:
+            weasyprint.CSS for _get_default_css()
+        """
+        if MarkdownConverter._default_stylesheet is None:
+            MarkdownConverter._default_stylesheet = CSS(string=self._get_default_css())
+        return MarkdownConverter._default_stylesheet
+
+    def _acquire_font_config(self):
+        """
+        Take an idle WeasyPrint font configuration, or create one if none is free.
+
+        Callers return it to _idle_font_configs once the render is done.
+
+        Returns:
+            weasyprint FontConfiguration
+        """
+        try:
+            return _idle_font_configs.get_nowait()
+        except queue.Empty:
+            return FontConfiguration()
+
+    def _get_default_css(self) -> str:
+        """
+        Get default CSS styling for PDF generation.
+
+        The title header is not included; see _get_title_css.
+
+        Returns:
+            CSS string with page layout and styling
+        """
+        return """
+        @page {
+            size: A4;
+            margin: 1in 0.75in;
+
+            @bottom-center {
+                content: "Page " counter(page) " of " counter(pages);
+                font-size: 10pt;
+                color: #666;
+                font-family: 'Helvetica', sans-serif;
+            }
+        }
+
+        @page :first {
+            @bottom-center {
+                content: "";
+            }
+        }
+
+        body {
             font-family: 'Georgia', serif;
             font-size: 11pt;
             line-height: 1.6;
             color: #333;
-        }}
+        }
 
-        h1, h2, h3, h4, h5, h6 {{
+        h1, h2, h3, h4, h5, h6 {
             font-family: 'Helvetica', sans-serif;
             color: #000;
             page-break-after: avoid;
-        }}
+        }
 
-        h1 {{
+        h1 {
             font-size: 24pt;
             margin-top: 0;
             border-bottom: 2px solid #333;
             padding-bottom: 10pt;
-        }}
+        }
 
-        h2 {{
+        h2 {
             font-size: 18pt;
             margin-top: 20pt;
             border-bottom: 1px solid #999;
             padding-bottom: 5pt;
-        }}
+        }
 
-        h3 {{
+        h3 {
             font-size: 14pt;
             margin-top: 15pt;
-        }}
+        }
 
-        p {{
+        p {
             margin: 0.5em 0;
             text-align: justify;
-        }}
+        }
 
-        code {{
+        code {
             background-color: #f4f4f4;
             padding: 2px 4px;
             border-radius: 3px;
             font-family: 'Courier New', monospace;
             font-size: 9pt;
             color: #c7254e;
-        }}
+        }
 
-        pre {{
+        pre {
             background-color: #f4f4f4;
             padding: 10pt;
             border-left: 3px solid #666;
             overflow-x: auto;
             page-break-inside: avoid;
             margin: 1em 0;
-        }}
+        }
 
-        pre code {{
+        pre code {
             background-color: transparent;
             padding: 0;
             color: inherit;
-        }}
+        }
 
-        blockquote {{
+        blockquote {
             border-left: 4px solid #ddd;
             padding-left: 15pt;
             margin-left: 0;
             color: #666;
             font-style: italic;
             page-break-inside: avoid;
-        }}
+        }
 
-        table {{
+        table {
             border-collapse: collapse;
             width: 100%;
             margin: 15pt 0;
             page-break-inside: avoid;
-        }}
+        }
 
-        th, td {{
+        th, td {
             border: 1px solid #ddd;
             padding: 8pt;
             text-align: left;
-        }}
+        }
 
-        th {{
+        th {
             background-color: #f4f4f4;
             font-weight: bold;
             color: #000;
-        }}
+        }
 
-        tr:nth-child(even) {{
+        tr:nth-child(even) {
             background-color: #fafafa;
-        }}
+        }
 
-        img {{
+        img {
             max-width: 100%;
             height: auto;
             display: block;
             margin: 1em auto;
-        }}
+        }
 
-        a {{
+        a {
             color: #0066cc;
             text-decoration: none;
-        }}
+        }
 
-        a:hover {{
+        a:hover {
             text-decoration: underline;
-        }}
+        }
 
-        ul, ol {{
+        ul, ol {
             margin: 0.5em 0;
             padding-left: 2em;
-        }}
+        }
 
-        li {{
+        li {
             margin: 0.25em 0;
-        }}
+        }
 
-        .front-matter {{
+        .front-matter {
             border: 2px solid #333;
             background-color: #f9f9f9;
             padding: 15pt;
             margin-bottom: 20pt;
             page-break-after: avoid;
-        }}
+        }
 
-        .front-matter h2 {{
+        .front-matter h2 {
             margin-top: 0;
             font-size: 14pt;
             border-bottom: none;
-        }}
+        }
 
-        .front-matter p {{
+        .front-matter p {
             margin: 0.25em 0;
             text-align: left;
-        }}
+        }
 
-        hr {{
+        hr {
             border: none;
             border-top: 1px solid #ccc;
             margin: 2em 0;
-        }}
+        }
         """
@@ -77,6 +77,39 @@ def encrypt_file(input_path: str, output_path: str, key: bytes) -> bool:
         return False
 
 
+def encrypt_to_file(data: bytes, output_path: str, key: bytes) -> bool:
+    """
+    Encrypt bytes and write the ciphertext to a file.
+
+    The plaintext is never written to disk.
+
+    Args:
+        data: Plaintext bytes
+        output_path: Path to save encrypted file
+        key: Fernet encryption key
+
+    Returns:
+        True if encryption successful, False otherwise
+
+    Example:
+        >>> key = generate_encryption_key()
+        >>> encrypt_to_file(pdf_bytes, 'document.pdf', key)
+        True
+    """
+    try:
+        ciphertext = Fernet(key).encrypt(data)
+
+        with open(output_path, 'wb') as f:
+            f.write(ciphertext)
+
+        logger.debug(f'Encrypted bytes to file: {output_path}')
+        return True
+
+    except Exception as e:
+        logger.error(f'Encryption failed: {e}', exc_info=True)
+        return False
+
+
 def decrypt_file(input_path: str, output_path: str, key: bytes) -> bool:
     """
     Decrypt a file using Fernet symmetric encryption.
@@ -224,27 +224,25 @@ def get_file_info(file_path: str) -> dict:
     }
 
 
-def is_job_expired(job_id: str, base_dir: str, max_age_hours: int = 24) -> bool:
+def is_job_expired(job_dir: str, max_age_hours: int = 24) -> bool:
     """
     Check if a job has expired based on directory age.
 
     Args:
-        job_id: Unique job identifier
-        base_dir: Base directory for converted files
+        job_dir: Path to the job directory (base_dir joined with job_id)
         max_age_hours: Maximum age in hours
 
     Returns:
         True if expired, False otherwise
     """
-    job_dir = Path(base_dir) / job_id
-
-    if not job_dir.exists():
-        return True  # Non-existent is considered expired
-
     try:
-        dir_mtime = datetime.fromtimestamp(job_dir.stat().st_mtime)
-        cutoff_time = datetime.now() - timedelta(hours=max_age_hours)
-        return dir_mtime < cutoff_time
+        # Single stat covers both the existence and the age check
+        dir_mtime = os.stat(job_dir).st_mtime
+    except FileNotFoundError:
+        return True  # Non-existent is considered expired
     except Exception as e:
         logger.error(f'Error checking job expiration: {e}')
         return True  # Assume expired on error
+
+    cutoff_time = (datetime.now() - timedelta(hours=max_age_hours)).timestamp()
+    return dir_mtime < cutoff_time
@@ -8,18 +8,53 @@ Implements caching to improve performance for repeated requests.
 Dependencies:
     - google-api-python-client: Google API client library
     - google-auth: OAuth2 credentials
+    - orjson: Fast JSON for Docs API request bodies (optional)
 
 Used by: app/api/routes.py for Google Docs conversion requests
 """
 from googleapiclient.discovery import build, Resource
+from googleapiclient.model import JsonModel
 from google.oauth2.credentials import Credentials
 from functools import lru_cache
 import logging
 import hashlib
 
+# Optional: orjson for faster Docs API request serialization
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
+class ORJSONModel(JsonModel):
+    """
+    googleapiclient JSON model that (de)serializes bodies with orjson.
+
+    Request bodies are emitted as UTF-8 bytes, so this model must not be
+    used for multipart media uploads (which need a str body). The Docs
+    API has no media methods, so it is only installed on that service.
+    """
+
+    def serialize(self, body_value):
+        """Serialize a request body to UTF-8 JSON bytes."""
+        if isinstance(body_value, dict) and 'data' not in body_value and self._data_wrapper:
+            body_value = {'data': body_value}
+        return orjson.dumps(body_value)
+
+    def deserialize(self, content):
+        """Deserialize a response body, returning it as-is if not JSON."""
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            return content.decode('utf-8') if isinstance(content, bytes) else content
+        if self._data_wrapper and isinstance(body, dict) and 'data' in body:
+            body = body['data']
+        return body
+
+
 def build_google_services(credentials: Credentials) -> tuple:
     """
     Build Google Docs and Drive API services.
@@ -44,7 +79,8 @@ def build_google_services(credentials: Credentials) -> tuple:
         'docs',
         'v1',
         credentials=credentials,
-        cache_discovery=False  # Reduce memory usage
+        cache_discovery=False,  # Reduce memory usage
+        model=ORJSONModel() if ORJSON_AVAILABLE else None  # batchUpdate bodies get large
     )
 
     drive_service = build(
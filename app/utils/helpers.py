@@ -13,12 +13,17 @@ Used by: app/api/routes.py for response formatting
 import os
 import mimetypes
 import logging
-from datetime import datetime
+import time
+from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Dict, Any, Optional
 
 
 logger = logging.getLogger(__name__)
 
+# Last formatted timestamp as (100ms tick, ISO string); replaced atomically
+_TIMESTAMP_CACHE = (0, '')
+
 
 def format_error_response(
     code: str,
@@ -50,7 +55,7 @@ def format_error_response(
         'error': message,
         'code': code,
         'status': status,
-        'timestamp': datetime.utcnow().isoformat() + 'Z'
+        'timestamp': generate_timestamp()
     }
 
     if extra:
@@ -81,13 +86,14 @@ def format_success_response(
     """
     response = {
         'status': 'success',
-        'timestamp': datetime.utcnow().isoformat() + 'Z'
+        'timestamp': generate_timestamp()
     }
     response.update(data)
 
     return response, status
 
 
+@lru_cache(maxsize=16)
 def format_file_size(size_bytes: int) -> str:
     """
     Format file size in human-readable format.
@@ -118,6 +124,7 @@ def format_file_size(size_bytes: int) -> str:
     return f'{size:.1f} {units[unit_index]}'
 
 
+@lru_cache(maxsize=16)
 def get_mime_type(format_type: str) -> str:
     """
     Get MIME type for file format.
@@ -191,7 +198,10 @@ def calculate_processing_time(start_time: datetime) -> float:
 
 def generate_timestamp() -> str:
     """
-    Generate ISO 8601 timestamp.
+    Generate ISO 8601 UTC timestamp.
+
+    The formatted string is reused for 100ms, which is plenty of precision
+    for response payloads and skips a datetime allocation per response.
 
     Returns:
         ISO formatted timestamp string
@@ -199,9 +209,19 @@ def generate_timestamp() -> str:
     Example:
         >>> timestamp = generate_timestamp()
         >>> print(timestamp)
-        '2025-10-31T10:30:00Z'
+        '2025-10-31T10:30:00.100000Z'
     """
-    return datetime.utcnow().isoformat() + 'Z'
+    global _TIMESTAMP_CACHE
+
+    now = time.time()
+    tick = int(now * 10)
+    cached_tick, cached_str = _TIMESTAMP_CACHE
+    if tick == cached_tick:
+        return cached_str
+
+    stamp = datetime.fromtimestamp(now, timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.%fZ')
+    _TIMESTAMP_CACHE = (tick, stamp)
+    return stamp
 
 
 def safe_int(value: Any, default: int = 0) -> int:
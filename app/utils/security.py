@@ -11,12 +11,31 @@ This module provides security utilities including:
 
 Used by: app/api/validators.py and app/converters/markdown_converter.py
 """
+import os
 import re
 import logging
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Union
 from werkzeug.utils import secure_filename as werkzeug_secure_filename
 
+try:
+    import nh3
+    NH3_AVAILABLE = True
+except ImportError:
+    NH3_AVAILABLE = False
+
+try:
+    import bleach
+    BLEACH_AVAILABLE = True
+except ImportError:
+    BLEACH_AVAILABLE = False
+
+try:
+    from lxml import etree
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
 
 logger = logging.getLogger(__name__)
 
@@ -163,7 +182,7 @@ def validate_file_content(content: str, max_size: int = 10 * 1024 * 1024) -> boo
     return True
 
 
-def check_allowed_extension(filename: str, allowed_extensions: set) -> bool:
+def check_allowed_extension(filename: str, allowed_extensions: frozenset) -> bool:
     """
     Check if file extension is allowed.
 
@@ -180,11 +199,11 @@ def check_allowed_extension(filename: str, allowed_extensions: set) -> bool:
         >>> check_allowed_extension('doc.exe', {'md', 'markdown'})
         False
     """
-    if '.' not in filename:
+    dot = filename.rfind('.')
+    if dot < 0:
         return False
 
-    ext = filename.rsplit('.', 1)[1].lower()
-    return ext in allowed_extensions
+    return filename[dot + 1:].lower() in allowed_extensions
 
 
 def sanitize_path_component(component: str) -> str:
@@ -328,19 +347,51 @@ ALLOWED_HTML_ATTRIBUTES = {
 
 ALLOWED_HTML_PROTOCOLS = ['http', 'https', 'data', 'mailto']
 
-# Note: CSS in style attributes is preserved since bleach 6.x doesn't filter CSS
+# Note: CSS in style attributes is preserved (neither sanitizer filters CSS)
 # This is acceptable because:
 # 1. Output is DOCX/PDF files, not web pages (no XSS risk)
 # 2. Pandoc and WeasyPrint sanitize CSS during rendering
 # 3. Dangerous tags (script, iframe, etc.) are still removed
 
+# Sanitizer backend: nh3 (Rust ammonia bindings) unless SANITIZER=bleach
+SANITIZER = os.environ.get('SANITIZER', 'nh3').lower()
+
+
+def _build_nh3_cleaner(strip_comments: bool):
+    """
+    Build a reusable nh3 cleaner for the HTML allow-lists.
+
+    Args:
+        strip_comments: Whether the cleaner strips HTML comments
+
+    Returns:
+        nh3.Cleaner instance
+    """
+    return nh3.Cleaner(
+        tags=set(ALLOWED_HTML_TAGS),
+        # ammonia drops <style> content by default; it is an allowed tag here
+        clean_content_tags={'script'},
+        attributes={tag: set(attrs) for tag, attrs in ALLOWED_HTML_ATTRIBUTES.items()},
+        url_schemes=set(ALLOWED_HTML_PROTOCOLS),
+        strip_comments=strip_comments,
+        link_rel=None  # Don't add rel="noopener noreferrer" to links
+    )
+
+
+# Built once per comment mode; cleaners are immutable and thread-safe
+_NH3_CLEANERS = (
+    {flag: _build_nh3_cleaner(flag) for flag in (True, False)}
+    if NH3_AVAILABLE else {}
+)
+
 
 def sanitize_html(html_content: str, strip_comments: bool = True) -> str:
     """
     Sanitize HTML content to prevent XSS attacks.
 
-    Uses bleach library to strip dangerous tags, attributes, and protocols
-    while preserving safe HTML structure and content.
+    Uses nh3 (or bleach when SANITIZER=bleach) to strip dangerous tags,
+    attributes, and protocols while preserving safe HTML structure and
+    content.
 
     Args:
         html_content: Raw HTML string to sanitize
@@ -359,17 +410,20 @@ def sanitize_html(html_content: str, strip_comments: bool = True) -> str:
         return ""
 
     try:
-        # Sanitize with bleach
-        # Note: Bleach 6.x removed the 'styles' parameter
-        # Since output is DOCX/PDF (not web), CSS in style attributes is safe
-        sanitized = bleach.clean(
-            html_content,
-            tags=ALLOWED_HTML_TAGS,
-            attributes=ALLOWED_HTML_ATTRIBUTES,
-            protocols=ALLOWED_HTML_PROTOCOLS,
-            strip=True,  # Remove disallowed tags entirely
-            strip_comments=strip_comments
-        )
+        if NH3_AVAILABLE and not (SANITIZER == 'bleach' and BLEACH_AVAILABLE):
+            sanitized = _NH3_CLEANERS[bool(strip_comments)].clean(html_content)
+        else:
+            # Sanitize with bleach
+            # Note: Bleach 6.x removed the 'styles' parameter
+            # Since output is DOCX/PDF (not web), CSS in style attributes is safe
+            sanitized = bleach.clean(
+                html_content,
+                tags=ALLOWED_HTML_TAGS,
+                attributes=ALLOWED_HTML_ATTRIBUTES,
+                protocols=ALLOWED_HTML_PROTOCOLS,
+                strip=True,  # Remove disallowed tags entirely
+                strip_comments=strip_comments
+            )
 
         logger.debug(f'HTML sanitized: {len(html_content)} -> {len(sanitized)} bytes')
         return sanitized
@@ -380,6 +434,52 @@ def sanitize_html(html_content: str, strip_comments: bool = True) -> str:
         return ""
 
 
+# Suspicious HTML constructs, logged (not blocked) during validation. One
+# alternation so the document is scanned once; group n names pattern n.
+_SUSPICIOUS_HTML_NAMES = (
+    'base tag',
+    'iframe tag',
+    'object tag',
+    'embed tag',
+    'javascript protocol',
+    'vbscript protocol',
+)
+_SUSPICIOUS_HTML_RE = re.compile(
+    r'(<base\s)|(<iframe)|(<object)|(<embed)|(javascript:)|(vbscript:)',
+    re.IGNORECASE
+)
+
+
+def validate_html_document(
+    content: str,
+    max_size: int = 10 * 1024 * 1024,
+    max_images: int = 100,
+    encoded: Optional[bytes] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Validate HTML content and its image count in one pass.
+
+    Combines validate_html_content and count_html_images: the content is
+    encoded once, and the same bytes are parsed once with lxml to count
+    images.
+
+    Args:
+        content: HTML content string
+        max_size: Maximum allowed size in bytes (default: 10MB)
+        max_images: Maximum allowed images per document (default: 100)
+        encoded: content already encoded as UTF-8, if the caller has it
+
+    Returns:
+        Error dictionary if invalid, None if valid
+    """
+    if encoded is None:
+        encoded = content.encode('utf-8')
+    error = _validate_html_text(content, len(encoded), max_size)
+    if error:
+        return error
+    return count_html_images(encoded if LXML_AVAILABLE else content, max_images)
+
+
 def validate_html_content(content: str, max_size: int = 10 * 1024 * 1024) -> Optional[Dict[str, Any]]:
     """
     Validate HTML content for safety and size limits.
@@ -396,8 +496,22 @@ def validate_html_content(content: str, max_size: int = 10 * 1024 * 1024) -> Opt
         >>> if error is None:
         >>>     # Content is valid
     """
+    return _validate_html_text(content, len(content.encode('utf-8')), max_size)
+
+
+def _validate_html_text(content: str, content_size: int, max_size: int) -> Optional[Dict[str, Any]]:
+    """
+    Check HTML size, binary data and emptiness, and log suspicious patterns.
+
+    Args:
+        content: HTML content string
+        content_size: UTF-8 encoded size of content in bytes
+        max_size: Maximum allowed size in bytes
+
+    Returns:
+        Error dictionary if invalid, None if valid
+    """
     # Check size
-    content_size = len(content.encode('utf-8'))
     if content_size > max_size:
         return {
             'error': f'HTML file too large: {content_size} bytes',
@@ -415,8 +529,8 @@ def validate_html_content(content: str, max_size: int = 10 * 1024 * 1024) -> Opt
             'status': 422
         }
 
-    # Check minimum length
-    if len(content.strip()) == 0:
+    # Check minimum length (isspace() scans in place, no stripped copy)
+    if not content or content.isspace():
         return {
             'error': 'HTML file is empty',
             'code': 'EMPTY_CONTENT',
@@ -424,18 +538,9 @@ def validate_html_content(content: str, max_size: int = 10 * 1024 * 1024) -> Opt
         }
 
     # Log suspicious patterns (but don't block - sanitization will handle)
-    suspicious_patterns = [
-        (r'<base\s', 'base tag'),
-        (r'<iframe', 'iframe tag'),
-        (r'<object', 'object tag'),
-        (r'<embed', 'embed tag'),
-        (r'javascript:', 'javascript protocol'),
-        (r'vbscript:', 'vbscript protocol'),
-    ]
-
-    for pattern, name in suspicious_patterns:
-        if re.search(pattern, content, re.IGNORECASE):
-            logger.warning(f'Suspicious pattern detected in HTML: {name}')
+    found = {match.lastindex for match in _SUSPICIOUS_HTML_RE.finditer(content)}
+    for group in sorted(found):
+        logger.warning(f'Suspicious pattern detected in HTML: {_SUSPICIOUS_HTML_NAMES[group - 1]}')
 
     # Valid
     return None
@@ -542,12 +647,14 @@ def validate_image_url(url: str) -> bool:
         return False
 
 
-def count_html_images(html_content: str, max_images: int = 100) -> Optional[Dict[str, Any]]:
+def count_html_images(html_content: Union[str, bytes], max_images: int = 100) -> Optional[Dict[str, Any]]:
     """
     Count images in HTML and check against limit (DOS prevention).
 
+    Parses with lxml when available, otherwise with BeautifulSoup.
+
     Args:
-        html_content: HTML content string
+        html_content: HTML content string (or its UTF-8 bytes)
         max_images: Maximum allowed images per document
 
     Returns:
@@ -558,12 +665,17 @@ def count_html_images(html_content: str, max_images: int = 100) -> Optional[Dict
         >>> if error:
         >>>     # Too many images
     """
-    from bs4 import BeautifulSoup
-
     try:
-        soup = BeautifulSoup(html_content, 'html.parser')
-        img_tags = soup.find_all('img')
-        count = len(img_tags)
+        if LXML_AVAILABLE:
+            if isinstance(html_content, str):
+                html_content = html_content.encode('utf-8')
+            root = etree.HTML(html_content)
+            count = 0 if root is None else sum(1 for _ in root.iter('img'))
+        else:
+            from bs4 import BeautifulSoup
+
+            soup = BeautifulSoup(html_content, 'html.parser')
+            count = len(soup.find_all('img'))
 
         if count > max_images:
             return {